@@ -11,9 +11,30 @@ Implements requirements:
 
 import asyncio
 import re
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Maximum concurrent subprocess spawns. Checks run concurrently at startup and
+# in health probes; bounding the spawn step (not the wait on output) limits
+# the burst of process creation from a memory-heavy worker.
+SPAWN_CONCURRENCY = 2
+
+# One semaphore per event loop: asyncio primitives bind to the loop they first
+# wait on, and tests or embedded servers may run several loops in turn.
+_spawn_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _spawn_semaphore() -> asyncio.Semaphore:
+    """Return the spawn semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _spawn_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _spawn_semaphores[loop] = asyncio.Semaphore(SPAWN_CONCURRENCY)
+    return semaphore
+
 
 @dataclass
 class CheckResult:
@@ -57,11 +78,13 @@ async def _run_binary_check(
     """
     proc = None
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        # Hold the semaphore only while spawning so the output waits overlap
+        async with _spawn_semaphore():
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
         stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
 
         if proc.returncode == 0:
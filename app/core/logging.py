@@ -4,7 +4,7 @@ import contextvars
 import hashlib
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, List, MutableMapping, Optional
 from uuid import uuid4
 
 import structlog
@@ -14,6 +14,10 @@ request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "request_id", default=None
 )
 
+# Most log records carry neither exc_info nor stack_info, so these processors
+# are only invoked through the gated wrappers below
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
 
 def hash_api_key(api_key: str) -> str:
     """
@@ -28,9 +32,30 @@ def hash_api_key(api_key: str) -> str:
     return f"sha256:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
 
 
-def add_request_id(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+def _maybe_stack_info(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """
+    Render stack info only when the log call asked for it
+
+    Args:
+        logger: The logger instance
+        method_name: The logging method name
+        event_dict: The event dictionary
+
+    Returns:
+        Event dictionary, with stack info rendered if requested
+    """
+    if "stack_info" in event_dict:
+        return _stack_info_renderer(logger, method_name, event_dict)
+    return event_dict
+
+
+def _maybe_exc_info(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
     """
-    Add request_id to log entries from context variable
+    Format exception info only when the log call carries it
 
     Args:
         logger: The logger instance
@@ -38,11 +63,10 @@ def add_request_id(logger: Any, method_name: str, event_dict: Dict[str, Any]) ->
         event_dict: The event dictionary
 
     Returns:
-        Updated event dictionary with request_id
+        Event dictionary, with exception info formatted if present
     """
-    request_id = request_id_var.get()
-    if request_id:
-        event_dict["request_id"] = request_id
+    if "exc_info" in event_dict:
+        return structlog.processors.format_exc_info(logger, method_name, event_dict)
     return event_dict
 
 
@@ -69,22 +93,21 @@ def configure_logging(log_level: str = "INFO", log_format: str = "json") -> None
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
-        add_request_id,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        _maybe_stack_info,
     ]
 
     # Format-specific processors
     processors: List[Any]
     if log_format == "json":
         processors = shared_processors + [
-            structlog.processors.format_exc_info,
+            _maybe_exc_info,
             structlog.processors.JSONRenderer(),
         ]
     else:
         # Console format for development
         processors = shared_processors + [
-            structlog.processors.format_exc_info,
+            _maybe_exc_info,
             structlog.dev.ConsoleRenderer(),
         ]
 
@@ -115,6 +138,9 @@ def set_request_id(request_id: Optional[str] = None) -> str:
     """
     Set request_id in context variable
 
+    The request_id is also bound to structlog's contextvars so that
+    merge_contextvars adds it to every log entry without a dedicated processor.
+
     Args:
         request_id: Optional request ID, generates UUID if not provided
 
@@ -124,6 +150,7 @@ def set_request_id(request_id: Optional[str] = None) -> str:
     if request_id is None:
         request_id = f"req_{uuid4().hex[:12]}"
     request_id_var.set(request_id)
+    structlog.contextvars.bind_contextvars(request_id=request_id)
     return request_id
 
 
@@ -140,3 +167,4 @@ def get_request_id() -> Optional[str]:
 def clear_request_id() -> None:
     """Clear request_id from context variable"""
     request_id_var.set(None)
+    structlog.contextvars.unbind_contextvars("request_id")
@@ -6,6 +6,8 @@ request rates, download operations, queue status, storage, and errors.
 Implements Requirement 29: Prometheus Metrics Export.
 """
 
+from typing import Dict, Tuple
+
 from prometheus_client import Counter, Gauge, Histogram, Info
 
 # Application info
@@ -80,11 +82,12 @@ errors_total = Counter(
     ["error_code", "endpoint"],
 )
 
-# Rate limiting metrics
+# Rate limiting metrics. Labelled by category only: a per-key label would grow
+# one series per key under a random-key flood.
 rate_limit_exceeded_total = Counter(
     "rate_limit_exceeded_total",
     "Total rate limit exceeded events",
-    ["api_key_hash", "category"],
+    ["category"],
 )
 
 # Webhook metrics
@@ -107,6 +110,11 @@ cookie_validation_total = Counter(
     ["provider", "result"],
 )
 
+# Labelled children of the HTTP metrics, keyed by (method, endpoint, status).
+# Resolving labels validates and hashes them on every call; the key space is
+# already bounded by the series the metrics themselves hold.
+_http_request_children: Dict[Tuple[str, str, int], Tuple[Counter, Histogram]] = {}
+
 
 class MetricsCollector:
     """Centralized metrics collection and update helper.
@@ -130,15 +138,16 @@ class MetricsCollector:
             status: HTTP response status code.
             duration: Request duration in seconds.
         """
-        http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status=str(status),
-        ).inc()
-        http_request_duration_seconds.labels(
-            method=method,
-            endpoint=endpoint,
-        ).observe(duration)
+        key = (method, endpoint, status)
+        children = _http_request_children.get(key)
+        if children is None:
+            children = (
+                http_requests_total.labels(method=method, endpoint=endpoint, status=str(status)),
+                http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+            )
+            _http_request_children[key] = children
+        children[0].inc()
+        children[1].observe(duration)
 
     @staticmethod
     def record_download(
@@ -199,17 +208,13 @@ class MetricsCollector:
         errors_total.labels(error_code=error_code, endpoint=endpoint).inc()
 
     @staticmethod
-    def record_rate_limit_exceeded(api_key_hash: str, category: str) -> None:
+    def record_rate_limit_exceeded(category: str) -> None:
         """Record a rate limit exceeded event.
 
         Args:
-            api_key_hash: Hashed API key (for privacy).
             category: Rate limit category ('metadata' or 'download').
         """
-        rate_limit_exceeded_total.labels(
-            api_key_hash=api_key_hash,
-            category=category,
-        ).inc()
+        rate_limit_exceeded_total.labels(category=category).inc()
 
     @staticmethod
     def update_cookie_age(provider: str, age_seconds: float) -> None:
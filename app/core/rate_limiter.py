@@ -6,16 +6,18 @@ Satisfies Requirement 27: Rate Limiting.
 
 import math
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 import structlog
 
+from app.core.metrics import MetricsCollector
+
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     """Token bucket for rate limiting.
 
@@ -23,38 +25,45 @@ class TokenBucket:
         capacity: Maximum number of tokens (burst capacity)
         refill_rate: Tokens added per second
         tokens: Current token count
-        last_refill: Timestamp of last refill
+        last_refill_ns: Monotonic timestamp of last refill, in nanoseconds
+        seconds_per_token: Inverse of refill_rate, used for Retry-After
     """
 
     capacity: int
     refill_rate: float
     tokens: float = field(default=math.nan)
-    last_refill: float = field(default_factory=time.time)
+    last_refill_ns: int = field(default_factory=time.monotonic_ns)
+    seconds_per_token: float = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize tokens to capacity if not set."""
+        """Initialize tokens to capacity if not set and precompute the inverse rate."""
         if math.isnan(self.tokens):
             self.tokens = float(self.capacity)
+        # Defensive: no refill configured, use 1 hour per token as fallback
+        self.seconds_per_token = 1.0 / self.refill_rate if self.refill_rate > 0 else 3600.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for a rate limit category.
 
     Attributes:
         rpm: Requests per minute (must be positive)
         burst_capacity: Maximum burst size (tokens, must be positive)
+        refill_rate: Tokens added per second, derived from rpm
     """
 
     rpm: int
     burst_capacity: int = 20
+    refill_rate: float = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Validate configuration values."""
+        """Validate configuration values and derive the refill rate."""
         if self.rpm <= 0:
             raise ValueError(f"rpm must be positive, got {self.rpm}")
         if self.burst_capacity <= 0:
             raise ValueError(f"burst_capacity must be positive, got {self.burst_capacity}")
+        self.refill_rate = self.rpm / 60.0
 
 
 class RateLimiter:
@@ -88,9 +97,6 @@ class RateLimiter:
     # DoS protection: maximum number of unique API keys to track
     MAX_API_KEYS: int = 10000
 
-    # Bucket inactivity threshold for cleanup (5 minutes)
-    BUCKET_INACTIVE_SECONDS: float = 300.0
-
     def __init__(
         self,
         limits: Optional[Dict[str, RateLimitConfig]] = None,
@@ -106,7 +112,30 @@ class RateLimiter:
         """
         self.limits = limits or self.DEFAULT_LIMITS.copy()
         self.endpoint_categories = endpoint_categories or self.ENDPOINT_CATEGORIES.copy()
-        self._buckets: Dict[str, Dict[str, TokenBucket]] = defaultdict(dict)
+        # Normalized endpoint -> category, for the common exact-match case
+        self._exact_lookup: Dict[str, str] = {
+            endpoint.rstrip("/"): category
+            for endpoint, category in self.endpoint_categories.items()
+        }
+        # Safe prefixes for query params (?url=...) or subpaths (/details), longest
+        # first. Avoids partial matches like /api/v1/info matching /api/v1/information
+        self._prefix_items: Tuple[Tuple[str, str], ...] = tuple(
+            sorted(
+                (
+                    (endpoint + separator, category)
+                    for endpoint, category in self._exact_lookup.items()
+                    for separator in ("?", "/")
+                ),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self._prefixes: Tuple[str, ...] = tuple(prefix for prefix, _ in self._prefix_items)
+        # Flat (api_key, category) keying in LRU order: one dict probe per check,
+        # least recently used bucket at the front
+        self._buckets: OrderedDict[Tuple[str, str], TokenBucket] = OrderedDict()
+        # Secondary index: categories holding a bucket per API key, for O(k) resets
+        self._categories_by_key: Dict[str, Set[str]] = {}
         self._max_api_keys = max_api_keys or self.MAX_API_KEYS
 
     def configure_limits(
@@ -148,49 +177,20 @@ class RateLimiter:
         Returns:
             Category name or None if path is not rate limited
         """
-        # Normalize path
+        # Normalize path, then direct match
         path = path.rstrip("/")
+        category = self._exact_lookup.get(path)
+        if category is not None:
+            return category
 
-        # Direct match
-        if path in self.endpoint_categories:
-            return self.endpoint_categories[path]
-
-        # Safe prefix match for query params (?url=...) or subpaths (/details)
-        # Avoids partial matches like /api/v1/info matching /api/v1/information
-        for endpoint, category in self.endpoint_categories.items():
-            if path.startswith(endpoint + "?") or path.startswith(endpoint + "/"):
-                return category
+        # Single C-level scan rejects the common non-API path before any loop
+        if path.startswith(self._prefixes):
+            for prefix, category in self._prefix_items:
+                if path.startswith(prefix):
+                    return category
 
         return None
 
-    def _cleanup_inactive_buckets(self) -> int:
-        """Remove buckets that haven't been used recently.
-
-        Returns:
-            Number of API keys removed
-        """
-        now = time.time()
-        threshold = now - self.BUCKET_INACTIVE_SECONDS
-        keys_to_remove = []
-
-        for api_key, categories in self._buckets.items():
-            # Check if all buckets for this key are inactive
-            all_inactive = all(bucket.last_refill < threshold for bucket in categories.values())
-            if all_inactive:
-                keys_to_remove.append(api_key)
-
-        for key in keys_to_remove:
-            del self._buckets[key]
-
-        if keys_to_remove:
-            logger.debug(
-                "rate_limiter_cleanup",
-                removed_keys=len(keys_to_remove),
-                remaining_keys=len(self._buckets),
-            )
-
-        return len(keys_to_remove)
-
     def _get_bucket(self, api_key: str, category: str) -> TokenBucket:
         """Get or create a token bucket for an API key and category.
 
@@ -201,41 +201,45 @@ class RateLimiter:
         Returns:
             TokenBucket for this key/category combination
         """
-        # DoS protection: cleanup inactive buckets if limit reached
-        if api_key not in self._buckets and len(self._buckets) >= self._max_api_keys:
-            self._cleanup_inactive_buckets()
-            # If still at limit after cleanup, log warning
-            if len(self._buckets) >= self._max_api_keys:
-                logger.warning(
-                    "rate_limiter_at_capacity",
-                    max_api_keys=self._max_api_keys,
-                    current_keys=len(self._buckets),
-                )
-
-        if category not in self._buckets[api_key]:
-            config = self.limits.get(category)
-            if config is None:
-                # Unknown category, use metadata limits as default
-                config = self.limits["metadata"]
-
-            self._buckets[api_key][category] = TokenBucket(
-                capacity=config.burst_capacity,
-                refill_rate=config.rpm / 60.0,  # Convert RPM to tokens per second
-            )
-        return self._buckets[api_key][category]
-
-    def _refill_bucket(self, bucket: TokenBucket) -> None:
-        """Refill a token bucket based on elapsed time.
+        key = (api_key, category)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+
+        # DoS protection: before tracking a new API key at the limit, evict
+        # least recently used buckets until one key has been dropped, so
+        # random-key floods keep a constant footprint
+        if api_key not in self._categories_by_key:
+            while len(self._categories_by_key) >= self._max_api_keys:
+                (evicted_api_key, evicted_category), _ = self._buckets.popitem(last=False)
+                self._unindex(evicted_api_key, evicted_category)
+
+        config = self.limits.get(category)
+        if config is None:
+            # Unknown category, use metadata limits as default
+            config = self.limits["metadata"]
+
+        bucket = TokenBucket(
+            capacity=config.burst_capacity,
+            refill_rate=config.refill_rate,
+        )
+        self._buckets[key] = bucket
+        self._categories_by_key.setdefault(api_key, set()).add(category)
+        return bucket
+
+    def _unindex(self, api_key: str, category: str) -> None:
+        """Remove a bucket from the per-API-key index.
 
         Args:
-            bucket: The bucket to refill
+            api_key: The API key identifier
+            category: The rate limit category
         """
-        now = time.time()
-        elapsed = now - bucket.last_refill
-        tokens_to_add = elapsed * bucket.refill_rate
-
-        bucket.tokens = min(bucket.capacity, bucket.tokens + tokens_to_add)
-        bucket.last_refill = now
+        categories = self._categories_by_key.get(api_key)
+        if categories is not None:
+            categories.discard(category)
+            if not categories:
+                del self._categories_by_key[api_key]
 
     async def check_rate_limit(
         self,
@@ -244,6 +248,12 @@ class RateLimiter:
     ) -> Tuple[bool, float]:
         """Check if a request is allowed under the rate limit.
 
+        The read-modify-write on the bucket contains no await point, so it is
+        atomic with respect to other coroutines on the event loop and needs no
+        lock. Keep it that way: an await between reading and storing tokens
+        would let concurrent requests over-admit. Each uvicorn worker process
+        holds its own buckets.
+
         Args:
             api_key: The API key making the request
             category: The rate limit category (e.g., "metadata", "download")
@@ -254,33 +264,28 @@ class RateLimiter:
             - retry_after_seconds: Seconds to wait before retry (0 if allowed)
         """
         bucket = self._get_bucket(api_key, category)
-        self._refill_bucket(bucket)
-
-        if bucket.tokens >= 1.0:
-            bucket.tokens -= 1.0
-            logger.debug(
-                "rate_limit_check_passed",
-                category=category,
-                tokens_remaining=bucket.tokens,
-            )
+
+        # Refill and consume in one pass over locals. Monotonic clock: immune to
+        # wall-clock jumps that would make the elapsed time negative.
+        rate = bucket.refill_rate
+        now_ns = time.monotonic_ns()
+        tokens = bucket.tokens + (now_ns - bucket.last_refill_ns) * 1e-9 * rate
+        capacity = bucket.capacity
+        if tokens > capacity:
+            tokens = capacity
+        bucket.last_refill_ns = now_ns
+
+        if tokens >= 1.0:
+            tokens -= 1.0
+            bucket.tokens = tokens
+            # No logging on the allowed path: it runs on every request
             return True, 0.0
-        else:
-            # Calculate retry after
-            tokens_needed = 1.0 - bucket.tokens
-            # Defensive check: avoid ZeroDivisionError if refill_rate is 0
-            if bucket.refill_rate > 0:
-                retry_after = tokens_needed / bucket.refill_rate
-            else:
-                # No refill configured, use 1 hour as fallback
-                retry_after = 3600.0
-
-            logger.info(
-                "rate_limit_exceeded",
-                category=category,
-                retry_after=retry_after,
-                tokens_available=bucket.tokens,
-            )
-            return False, retry_after
+
+        bucket.tokens = tokens
+        # Count rejections instead of logging each one; the middleware logs the
+        # request context for the 429 it returns
+        MetricsCollector.record_rate_limit_exceeded(category)
+        return False, (1.0 - tokens) * bucket.seconds_per_token
 
     def get_bucket_status(self, api_key: str, category: str) -> Dict:
         """Get current status of a rate limit bucket.
@@ -292,17 +297,20 @@ class RateLimiter:
         Returns:
             Dict with bucket status including tokens, capacity, and limits
         """
-        if api_key not in self._buckets or category not in self._buckets[api_key]:
+        bucket = self._buckets.get((api_key, category))
+        if bucket is None:
             config = self.limits.get(category, self.limits["metadata"])
             return {
                 "tokens": config.burst_capacity,
                 "capacity": config.burst_capacity,
-                "refill_rate": config.rpm / 60.0,
+                "refill_rate": config.refill_rate,
                 "rpm": config.rpm,
             }
 
-        bucket = self._buckets[api_key][category]
-        self._refill_bucket(bucket)
+        now_ns = time.monotonic_ns()
+        elapsed = (now_ns - bucket.last_refill_ns) * 1e-9
+        bucket.tokens = min(bucket.capacity, bucket.tokens + elapsed * bucket.refill_rate)
+        bucket.last_refill_ns = now_ns
 
         return {
             "tokens": bucket.tokens,
@@ -318,20 +326,21 @@ class RateLimiter:
             api_key: The API key
             category: Specific category to reset, or None for all categories
         """
-        if api_key in self._buckets:
-            if category:
-                if category in self._buckets[api_key]:
-                    del self._buckets[api_key][category]
-            else:
-                del self._buckets[api_key]
+        if category:
+            self._buckets.pop((api_key, category), None)
+            self._unindex(api_key, category)
+        else:
+            for key_category in self._categories_by_key.pop(api_key, ()):
+                self._buckets.pop((api_key, key_category), None)
 
     def clear_all_buckets(self) -> None:
         """Clear all rate limit buckets. Useful for testing."""
         self._buckets.clear()
+        self._categories_by_key.clear()
 
 
-# Global rate limiter instance
-_rate_limiter: Optional[RateLimiter] = None
+# Global rate limiter instance, created at import so lookups never branch
+_rate_limiter: RateLimiter = RateLimiter()
 
 
 def get_rate_limiter() -> RateLimiter:
@@ -340,9 +349,6 @@ def get_rate_limiter() -> RateLimiter:
     Returns:
         The configured RateLimiter instance
     """
-    global _rate_limiter
-    if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
     return _rate_limiter
 
 
@@ -353,6 +359,9 @@ def configure_rate_limiter(
 ) -> RateLimiter:
     """Configure the global rate limiter with custom settings.
 
+    The instance is updated in place and existing buckets are dropped so that
+    the new limits apply to every key.
+
     Args:
         metadata_rpm: Requests per minute for metadata operations
         download_rpm: Requests per minute for download operations
@@ -361,10 +370,10 @@ def configure_rate_limiter(
     Returns:
         The configured RateLimiter instance
     """
-    limiter = get_rate_limiter()
-    limiter.configure_limits(
+    _rate_limiter.configure_limits(
         metadata_rpm=metadata_rpm,
         download_rpm=download_rpm,
         burst_capacity=burst_capacity,
     )
-    return limiter
+    _rate_limiter.clear_all_buckets()
+    return _rate_limiter
@@ -7,17 +7,31 @@ Implements requirements:
 - Req 47: Graceful Startup Mode (resource validation)
 """
 
+import os
+import time
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import psutil
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Bytes to GiB as a multiplication
+_INV_GIB = 1.0 / (1 << 30)
 
-@dataclass
+# Resource readings don't need sub-second freshness; reuse them for this long
+USAGE_CACHE_TTL_SECONDS = 2.0
+
+# Cached readings per disk path: (monotonic timestamp, usage)
+_usage_cache: Dict[Optional[str], Tuple[float, "ResourceUsage"]] = {}
+
+# psutil.cpu_percent(interval=None) reports usage since the previous call;
+# the first read has no baseline, so it takes a short blocking sample instead
+_cpu_primed = False
+
+
+@dataclass(slots=True)
 class ResourceUsage:
     """Current system resource usage.
 
@@ -40,7 +54,7 @@ class ResourceUsage:
     disk_percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRequirements:
     """Minimum resource requirements.
 
@@ -57,7 +71,7 @@ class ResourceRequirements:
     warn_disk_gb: float = 20.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceCheckResult:
     """Result of resource validation.
 
@@ -74,43 +88,66 @@ class ResourceCheckResult:
     warnings: list[str]
 
 
-def get_current_usage(disk_path: Optional[str] = None) -> ResourceUsage:
+def get_current_usage(
+    disk_path: Optional[str] = None,
+    max_age: float = USAGE_CACHE_TTL_SECONDS,
+) -> ResourceUsage:
     """Get current system resource usage.
 
+    Readings younger than max_age seconds are served from a per-path cache.
+
     Args:
         disk_path: Path to check disk usage for. Defaults to root filesystem.
+        max_age: Maximum age in seconds of a cached reading. 0 forces a fresh read.
 
     Returns:
         ResourceUsage with current resource metrics.
     """
-    # CPU usage (1 second interval for accuracy)
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+    now = time.monotonic()
+    cached = _usage_cache.get(disk_path)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+
+    # CPU usage since the previous call (non-blocking once primed)
+    global _cpu_primed
+    if _cpu_primed:
+        cpu_percent = psutil.cpu_percent(interval=None)
+    else:
+        cpu_percent = psutil.cpu_percent(interval=0.1)
+        _cpu_primed = True
 
     # Memory usage
     memory = psutil.virtual_memory()
-    memory_total_gb = memory.total / (1024**3)
-    memory_available_gb = memory.available / (1024**3)
+    memory_total_gb = memory.total * _INV_GIB
+    memory_available_gb = memory.available * _INV_GIB
     memory_percent = memory.percent
 
-    # Disk usage
-    path = Path(disk_path) if disk_path else Path("/")
-    if not path.exists():
-        path = Path("/")
-
-    disk = psutil.disk_usage(str(path))
-    disk_total_gb = disk.total / (1024**3)
-    disk_available_gb = disk.free / (1024**3)
-    disk_percent = disk.percent
-
-    return ResourceUsage(
-        cpu_percent=round(cpu_percent, 1),
-        memory_total_gb=round(memory_total_gb, 2),
-        memory_available_gb=round(memory_available_gb, 2),
-        memory_percent=round(memory_percent, 1),
-        disk_total_gb=round(disk_total_gb, 2),
-        disk_available_gb=round(disk_available_gb, 2),
-        disk_percent=round(disk_percent, 1),
+    # Disk usage: a single statvfs call, falling back to root for missing paths
+    try:
+        disk = os.statvfs(disk_path or "/")
+    except (FileNotFoundError, NotADirectoryError):
+        disk = os.statvfs("/")
+    block_size = disk.f_frsize
+    disk_total = disk.f_blocks * block_size
+    disk_free = disk.f_bavail * block_size
+    disk_used = (disk.f_blocks - disk.f_bfree) * block_size
+    disk_total_gb = disk_total * _INV_GIB
+    disk_available_gb = disk_free * _INV_GIB
+    # Same formula as psutil.disk_usage: reserved blocks count as neither used nor free
+    disk_percent = disk_used / (disk_used + disk_free) * 100 if disk_used + disk_free else 0.0
+
+    # Values are left unrounded; format them where they are displayed
+    usage = ResourceUsage(
+        cpu_percent=cpu_percent,
+        memory_total_gb=memory_total_gb,
+        memory_available_gb=memory_available_gb,
+        memory_percent=memory_percent,
+        disk_total_gb=disk_total_gb,
+        disk_available_gb=disk_available_gb,
+        disk_percent=disk_percent,
     )
+    _usage_cache[disk_path] = (now, usage)
+    return usage
 
 
 def check_minimum_resources(
@@ -163,21 +200,21 @@ def check_minimum_resources(
         logger.error(
             "resource_check_failed",
             errors=errors,
-            memory_available_gb=usage.memory_available_gb,
-            disk_available_gb=usage.disk_available_gb,
+            memory_available_gb=round(usage.memory_available_gb, 2),
+            disk_available_gb=round(usage.disk_available_gb, 2),
         )
     elif warnings:
         logger.warning(
             "resource_check_warnings",
             warnings=warnings,
-            memory_available_gb=usage.memory_available_gb,
-            disk_available_gb=usage.disk_available_gb,
+            memory_available_gb=round(usage.memory_available_gb, 2),
+            disk_available_gb=round(usage.disk_available_gb, 2),
         )
     else:
         logger.info(
             "resource_check_passed",
-            memory_available_gb=usage.memory_available_gb,
-            disk_available_gb=usage.disk_available_gb,
+            memory_available_gb=round(usage.memory_available_gb, 2),
+            disk_available_gb=round(usage.disk_available_gb, 2),
         )
 
     return ResourceCheckResult(
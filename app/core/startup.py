@@ -12,11 +12,15 @@ Implements requirements:
 - Req 47: Graceful Startup Mode (degraded mode support)
 """
 
+import asyncio
+import dataclasses
 import os
 import re
+import time
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import structlog
 
@@ -25,13 +29,17 @@ from app.core.config import Config
 
 logger = structlog.get_logger(__name__)
 
+# A Netscape cookie entry: a non-comment line with exactly 7 tab-separated
+# fields and at least one non-whitespace character
+_NETSCAPE_ENTRY_RE = re.compile(rb"(?m)^(?!#)(?=[^\n]*\S)[^\t\n]*(?:\t[^\t\n]*){6}$")
+
 
 def _is_test_mode() -> bool:
     """Check if test mode is enabled via environment variable."""
     return os.environ.get("APP_TESTING_TEST_MODE", "").lower() in ("true", "1", "yes")
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentCheckResult:
     """Result of a startup component check.
 
@@ -41,7 +49,7 @@ class ComponentCheckResult:
         critical: If True, failure blocks startup (unless degraded mode)
         version: Version string if available
         message: Human-readable message about the result
-        details: Additional details about the check
+        details: Additional details about the check, None when there are none
     """
 
     name: str
@@ -49,10 +57,129 @@ class ComponentCheckResult:
     critical: bool
     version: Optional[str] = None
     message: Optional[str] = None
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def ok(
+        cls,
+        name: str,
+        critical: bool,
+        *,
+        version: Optional[str] = None,
+        message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> "ComponentCheckResult":
+        """Create a passing result.
+
+        Args:
+            name: Component name.
+            critical: Whether a failure of this component blocks startup.
+            version: Version string if available.
+            message: Human-readable message.
+            details: Additional details, if any.
+
+        Returns:
+            ComponentCheckResult with passed=True.
+        """
+        return cls(
+            name=name,
+            passed=True,
+            critical=critical,
+            version=version,
+            message=message,
+            details=details,
+        )
+
+    @classmethod
+    def fail(cls, name: str, critical: bool, message: str) -> "ComponentCheckResult":
+        """Create a failing result.
+
+        Args:
+            name: Component name.
+            critical: Whether this failure blocks startup.
+            message: Human-readable reason for the failure.
+
+        Returns:
+            ComponentCheckResult with passed=False.
+        """
+        return cls(name=name, passed=False, critical=critical, message=message)
+
+
+# Passing binary checks are reused across validator runs for this long, so
+# revalidation within the window skips the subprocess launches
+BINARY_CHECK_CACHE_TTL_SECONDS = 60.0
+
+# Cached passing results keyed by (component, minimum version)
+_binary_check_cache: Dict[Tuple[str, int], Tuple[float, ComponentCheckResult]] = {}
+# Probe locks per event loop, then per key: asyncio locks bind to the loop
+# they first wait on, and tests or embedded servers may run several loops
+_binary_check_locks: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], asyncio.Lock]]"
+) = weakref.WeakKeyDictionary()
+
+# Passing cookie checks keyed by (cookie path, detailed), with the
+# (st_mtime_ns, st_size) they were computed for. An unchanged file is not
+# re-read on revalidation.
+_cookie_check_cache: Dict[Tuple[str, bool], Tuple[int, int, ComponentCheckResult]] = {}
+
+
+async def _cached_check(
+    key: Tuple[str, int],
+    probe: Callable[[], Awaitable[ComponentCheckResult]],
+) -> ComponentCheckResult:
+    """Return a recent passing result for key, or run the probe.
+
+    A per-key lock makes concurrent validations share a single probe.
+    Failed results are not cached so a fixed installation is picked up
+    on the next run.
+
+    Args:
+        key: Cache key as (component name, minimum version).
+        probe: Coroutine function performing the real check.
+
+    Returns:
+        ComponentCheckResult, copied so callers can mutate details freely.
+    """
+    loop = asyncio.get_running_loop()
+    locks = _binary_check_locks.get(loop)
+    if locks is None:
+        locks = _binary_check_locks[loop] = {}
+    lock = locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _binary_check_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < BINARY_CHECK_CACHE_TTL_SECONDS:
+            result = cached[1]
+        else:
+            result = await probe()
+            if not result.passed:
+                return result
+            _binary_check_cache[key] = (time.monotonic(), result)
+    return _copy_result(result)
 
 
-@dataclass
+def _copy_result(result: ComponentCheckResult) -> ComponentCheckResult:
+    """Copy a cached result so callers can mutate details freely.
+
+    Args:
+        result: Cached check result.
+
+    Returns:
+        A new ComponentCheckResult with the same fields.
+    """
+    if result.details is None:
+        return dataclasses.replace(result)
+    return dataclasses.replace(result, details=dict(result.details))
+
+
+def clear_startup_cache() -> None:
+    """Drop cached startup check state. Useful for testing."""
+    _binary_check_cache.clear()
+    _binary_check_locks.clear()
+    _cookie_check_cache.clear()
+    StartupValidator._configured_runtime_files.clear()
+
+
+@dataclass(slots=True)
 class StartupResult:
     """Result of full startup validation.
 
@@ -93,6 +220,9 @@ class StartupValidator:
     # In test mode, ytdlp is not critical as we use mock executor
     ALWAYS_CRITICAL_COMPONENTS = {"ytdlp", "storage"}
 
+    # yt-dlp config files already confirmed to carry the Node.js runtime flag
+    _configured_runtime_files: Set[str] = set()
+
     @property
     def critical_components(self) -> set:
         """Get set of critical components based on mode."""
@@ -101,16 +231,20 @@ class StartupValidator:
             return {"storage"}
         return self.ALWAYS_CRITICAL_COMPONENTS
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, detailed_cookies: bool = False):
         """Initialize the startup validator.
 
         Args:
             config: Application configuration.
+            detailed_cookies: Count every valid cookie entry and report it in
+                the check details. Otherwise validation stops at the first
+                valid entry.
         """
         self.config = config
+        self.detailed_cookies = detailed_cookies
         self.allow_degraded = config.security.allow_degraded_start
         self.results: List[ComponentCheckResult] = []
-        self.disabled_providers: List[str] = []
+        self.disabled_providers: Set[str] = set()
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
@@ -127,7 +261,7 @@ class StartupValidator:
 
         # Reset state for fresh validation
         self.results = []
-        self.disabled_providers = []
+        self.disabled_providers = set()
         self.errors = []
         self.warnings = []
 
@@ -135,13 +269,11 @@ class StartupValidator:
         await self._run_checks()
 
         # Determine overall status
-        critical_failures = [r for r in self.results if not r.passed and r.critical]
-        non_critical_failures = [r for r in self.results if not r.passed and not r.critical]
+        critical_failures, non_critical_failures, nodejs_check = self._classify_results()
 
         # Configure yt-dlp runtime if Node.js is available
-        nodejs_check = next((r for r in self.results if r.name == "nodejs"), None)
         if nodejs_check and nodejs_check.passed:
-            self.configure_ytdlp_runtime()
+            await asyncio.to_thread(self.configure_ytdlp_runtime)
 
         # Determine if we can start
         if critical_failures:
@@ -174,11 +306,12 @@ class StartupValidator:
         for r in non_critical_failures:
             self.warnings.append(f"{r.name}: {r.message}")
 
+        disabled_providers = sorted(self.disabled_providers)
         result = StartupResult(
             success=success,
             degraded_mode=degraded_mode,
             checks=self.results,
-            disabled_providers=self.disabled_providers,
+            disabled_providers=disabled_providers,
             errors=self.errors,
             warnings=self.warnings,
         )
@@ -188,123 +321,151 @@ class StartupValidator:
             "startup_validation_completed",
             success=success,
             degraded_mode=degraded_mode,
-            disabled_providers=self.disabled_providers,
+            disabled_providers=disabled_providers,
             error_count=len(self.errors),
             warning_count=len(self.warnings),
         )
 
         return result
 
-    async def _run_checks(self) -> None:
-        """Run all component checks."""
-        # Check external binaries (critical)
-        ytdlp_result = await self.check_ytdlp()
-        self.results.append(ytdlp_result)
+    def _classify_results(
+        self,
+    ) -> Tuple[
+        List[ComponentCheckResult], List[ComponentCheckResult], Optional[ComponentCheckResult]
+    ]:
+        """Split failed checks by criticality and find the Node.js result in one pass.
 
-        ffmpeg_result = await self.check_ffmpeg()
-        self.results.append(ffmpeg_result)
+        Returns:
+            Tuple of (critical_failures, non_critical_failures, nodejs_check).
+        """
+        critical_failures: List[ComponentCheckResult] = []
+        non_critical_failures: List[ComponentCheckResult] = []
+        nodejs_check: Optional[ComponentCheckResult] = None
+        for r in self.results:
+            if r.name == "nodejs":
+                nodejs_check = r
+            if not r.passed:
+                (critical_failures if r.critical else non_critical_failures).append(r)
+        return critical_failures, non_critical_failures, nodejs_check
 
-        nodejs_result = await self.check_nodejs()
-        self.results.append(nodejs_result)
+    async def _run_checks(self) -> None:
+        """Run all component checks concurrently.
 
-        # Check storage (critical)
-        storage_result = await self.check_storage()
-        self.results.append(storage_result)
+        The checks are independent, so startup waits for the slowest one
+        rather than the sum. Results keep a fixed order for deterministic
+        reporting, and a check that raises is recorded as a failure instead
+        of cancelling its siblings.
+        """
+        names = ("ytdlp", "ffmpeg", "nodejs", "storage", "cookies")
+        outcomes = await asyncio.gather(
+            self.check_ytdlp(),
+            self.check_ffmpeg(),
+            self.check_nodejs(),
+            self.check_storage(),
+            self.check_cookies(),
+            return_exceptions=True,
+        )
 
-        # Check cookies (non-critical in degraded mode)
-        cookie_result = await self.check_cookies()
-        self.results.append(cookie_result)
+        for name, outcome in zip(names, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("startup_check_crashed", component=name, error=str(outcome))
+                message = f"{name} check failed unexpectedly: {outcome}"
+                if name == "cookies":
+                    outcome = self._cookie_failure(message)
+                else:
+                    outcome = ComponentCheckResult.fail(name, True, message)
+            self.results.append(outcome)
 
     async def check_ytdlp(self) -> ComponentCheckResult:
         """Check yt-dlp availability and version.
 
         This is a CRITICAL check - startup fails if yt-dlp is not available.
+        Passing results are cached for BINARY_CHECK_CACHE_TTL_SECONDS.
 
         Returns:
             ComponentCheckResult with yt-dlp status.
         """
+        return await _cached_check(("ytdlp", 0), self._probe_ytdlp)
+
+    async def _probe_ytdlp(self) -> ComponentCheckResult:
+        """Run the yt-dlp check subprocess."""
         result = await check_ytdlp()
 
         if result.available:
             logger.info("ytdlp_check_passed", version=result.version)
-            return ComponentCheckResult(
-                name="ytdlp",
-                passed=True,
-                critical=True,
-                version=result.version,
-                message="yt-dlp is available",
+            return ComponentCheckResult.ok(
+                "ytdlp", True, version=result.version, message="yt-dlp is available"
             )
 
         logger.error("ytdlp_check_failed", error=result.error)
-        return ComponentCheckResult(
-            name="ytdlp",
-            passed=False,
-            critical=True,
-            message=result.error or "yt-dlp is not available",
-        )
+        return ComponentCheckResult.fail("ytdlp", True, result.error or "yt-dlp is not available")
 
     async def check_ffmpeg(self) -> ComponentCheckResult:
         """Check ffmpeg availability and version.
 
         This is a CRITICAL check - startup fails if ffmpeg is not available.
+        Passing results are cached for BINARY_CHECK_CACHE_TTL_SECONDS.
 
         Returns:
             ComponentCheckResult with ffmpeg status.
         """
+        return await _cached_check(("ffmpeg", 0), self._probe_ffmpeg)
+
+    async def _probe_ffmpeg(self) -> ComponentCheckResult:
+        """Run the ffmpeg check subprocess."""
         result = await check_ffmpeg()
 
         if result.available:
             logger.info("ffmpeg_check_passed", version=result.version)
-            return ComponentCheckResult(
-                name="ffmpeg",
-                passed=True,
-                critical=True,
-                version=result.version,
-                message="ffmpeg is available",
+            return ComponentCheckResult.ok(
+                "ffmpeg", True, version=result.version, message="ffmpeg is available"
             )
 
         logger.error("ffmpeg_check_failed", error=result.error)
-        return ComponentCheckResult(
-            name="ffmpeg",
-            passed=False,
-            critical=True,
-            message=result.error or "ffmpeg is not available",
-        )
+        return ComponentCheckResult.fail("ffmpeg", True, result.error or "ffmpeg is not available")
 
     async def check_nodejs(self) -> ComponentCheckResult:
         """Check Node.js availability and version >= 20.
 
         This is a CRITICAL check - Node.js >= 20 is required for
-        JavaScript challenge resolution (Req 10).
+        JavaScript challenge resolution (Req 10). Passing results are cached
+        for BINARY_CHECK_CACHE_TTL_SECONDS.
 
         Returns:
             ComponentCheckResult with Node.js status.
         """
+        return await _cached_check(("nodejs", self.MIN_NODEJS_VERSION), self._probe_nodejs)
+
+    async def _probe_nodejs(self) -> ComponentCheckResult:
+        """Run the Node.js check subprocess."""
         result = await check_nodejs(min_version=self.MIN_NODEJS_VERSION)
 
         if result.available:
             logger.info("nodejs_check_passed", version=result.version)
-            return ComponentCheckResult(
-                name="nodejs",
-                passed=True,
-                critical=True,
-                version=result.version,
-                message="Node.js is available",
+            return ComponentCheckResult.ok(
+                "nodejs", True, version=result.version, message="Node.js is available"
             )
 
         logger.error("nodejs_check_failed", error=result.error)
-        return ComponentCheckResult(
-            name="nodejs",
-            passed=False,
-            critical=True,
-            message=result.error or f"Node.js >= {self.MIN_NODEJS_VERSION} is required",
+        return ComponentCheckResult.fail(
+            "nodejs", True, result.error or f"Node.js >= {self.MIN_NODEJS_VERSION} is required"
         )
 
     async def check_storage(self) -> ComponentCheckResult:
         """Check storage directory availability and permissions.
 
         This is a CRITICAL check - startup fails if storage is not writable.
-        Creates the output directory if it doesn't exist.
+        Creates the output directory if it doesn't exist. The filesystem
+        calls run in a worker thread so they overlap with the subprocess
+        checks instead of blocking the event loop.
+
+        Returns:
+            ComponentCheckResult with storage status.
+        """
+        return await asyncio.to_thread(self._check_storage_sync)
+
+    def _check_storage_sync(self) -> ComponentCheckResult:
+        """Blocking body of check_storage.
 
         Returns:
             ComponentCheckResult with storage status.
@@ -312,45 +473,45 @@ class StartupValidator:
         output_dir = Path(self.config.storage.output_dir)
 
         try:
-            # Create directory if it doesn't exist
-            if not output_dir.exists():
-                output_dir.mkdir(parents=True, exist_ok=True)
-                logger.info("output_directory_created", path=str(output_dir))
-
-            # Test write permissions
-            test_file = output_dir / f".write_test_{os.getpid()}"
+            # Create directory if it doesn't exist. EAFP: the mkdir result tells
+            # created from existing without a separate exists() stat.
             try:
-                test_file.touch()
-                test_file.unlink(missing_ok=True)
-            except PermissionError:
-                logger.error(
-                    "storage_permission_error",
-                    path=str(output_dir),
-                )
-                return ComponentCheckResult(
-                    name="storage",
-                    passed=False,
-                    critical=True,
-                    message=f"Cannot write to output directory: {output_dir}",
-                )
+                output_dir.mkdir(parents=True)
+                logger.info("output_directory_created", path=str(output_dir))
+            except FileExistsError:
+                pass
+
+            # Test write permissions. os.access answers with one syscall and no
+            # directory churn; it can report false negatives under ACLs or
+            # root-squash, so a "no" is confirmed with a real probe file.
+            probe = "access"
+            # The trailing separator makes the call fail for a non-directory.
+            if not os.access(f"{output_dir}{os.sep}", os.W_OK | os.X_OK):
+                probe = "touch"
+                test_file = output_dir / f".write_test_{os.getpid()}"
+                try:
+                    test_file.touch()
+                    test_file.unlink(missing_ok=True)
+                except PermissionError:
+                    logger.error(
+                        "storage_permission_error",
+                        path=str(output_dir),
+                    )
+                    return ComponentCheckResult.fail(
+                        "storage", True, f"Cannot write to output directory: {output_dir}"
+                    )
 
-            logger.info("storage_check_passed", path=str(output_dir))
-            return ComponentCheckResult(
-                name="storage",
-                passed=True,
-                critical=True,
+            logger.info("storage_check_passed", path=str(output_dir), probe=probe)
+            return ComponentCheckResult.ok(
+                "storage",
+                True,
                 message="Storage is available and writable",
-                details={"output_dir": str(output_dir)},
+                details={"output_dir": str(output_dir), "probe": probe},
             )
 
         except OSError as e:
             logger.error("storage_check_failed", path=str(output_dir), error=str(e))
-            return ComponentCheckResult(
-                name="storage",
-                passed=False,
-                critical=True,
-                message=f"Storage check failed: {e}",
-            )
+            return ComponentCheckResult.fail("storage", True, f"Storage check failed: {e}")
 
     def _cookie_failure(self, message: str, provider: str = "youtube") -> ComponentCheckResult:
         """Create a cookie check failure result.
@@ -365,22 +526,32 @@ class StartupValidator:
         if self.allow_degraded:
             # In test mode, don't disable providers (we use mocks)
             if not _is_test_mode():
-                self.disabled_providers.append(provider)
-            return ComponentCheckResult(
-                name="cookies",
-                passed=False,
-                critical=False,
-                message=message,
-            )
-        return ComponentCheckResult(
-            name="cookies",
-            passed=False,
-            critical=True,
-            message=message,
+                self.disabled_providers.add(provider)
+            return ComponentCheckResult.fail("cookies", False, message)
+        return ComponentCheckResult.fail("cookies", True, message)
+
+    def _cookie_success(self, cookie_path: str, valid_entries: int) -> ComponentCheckResult:
+        """Create a cookie check success result.
+
+        Args:
+            cookie_path: Configured cookie path string.
+            valid_entries: Valid entry count, reported only in detailed mode.
+
+        Returns:
+            Passing ComponentCheckResult.
+        """
+        details: Dict[str, Any] = {"path": cookie_path}
+        if self.detailed_cookies:
+            details["valid_entries"] = valid_entries
+        logger.info("cookies_check_passed", **details)
+        return ComponentCheckResult.ok(
+            "cookies", False, message="Cookie file is valid", details=details
         )
 
-    def _check_cookie_access(self, path: Path, cookie_path: str) -> Optional[ComponentCheckResult]:
-        """Verify the cookie file exists and is accessible.
+    def _stat_cookie_file(
+        self, path: Path, cookie_path: str
+    ) -> Union[os.stat_result, ComponentCheckResult]:
+        """Stat the cookie file, checking that it exists and is accessible.
 
         Guards against unreadable paths/mounts: os.stat raises
         PermissionError there, which must degrade the check, not crash
@@ -391,23 +562,54 @@ class StartupValidator:
             cookie_path: Configured cookie path string (for messages).
 
         Returns:
-            A failure ComponentCheckResult, or None when accessible.
+            The file's stat result, or a failure ComponentCheckResult.
         """
         try:
-            if path.exists():
-                return None
+            return path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning("youtube_cookie_not_found", path=cookie_path)
+            return self._cookie_failure(f"Cookie file not found: {cookie_path}")
         except OSError as e:
             logger.error("youtube_cookie_access_error", path=cookie_path, error=str(e))
             return self._cookie_failure(f"Cannot access cookie file: {cookie_path} ({e})")
 
-        logger.warning("youtube_cookie_not_found", path=cookie_path)
-        return self._cookie_failure(f"Cookie file not found: {cookie_path}")
+    @staticmethod
+    def _count_cookie_entries(path: Path, stop_at_first: bool = False) -> Optional[int]:
+        """Count valid Netscape cookie entries in a single regex pass.
+
+        Matching runs over the raw bytes in the C regex engine rather than
+        a per-line Python loop, which matters for multi-thousand-line files.
+
+        Args:
+            path: Cookie file path.
+            stop_at_first: Stop at the first valid entry, so the count is at
+                most 1. Enough to decide pass/fail.
+
+        Returns:
+            Number of non-comment lines with 7 tab-separated fields, or None
+            when the file has no non-blank lines at all.
+        """
+        data = path.read_bytes()
+        if not data.strip():
+            return None
+        if stop_at_first:
+            return 1 if _NETSCAPE_ENTRY_RE.search(data) else 0
+        return sum(1 for _ in _NETSCAPE_ENTRY_RE.finditer(data))
 
     async def check_cookies(self) -> ComponentCheckResult:
         """Check cookie file availability and format.
 
         This is a NON-CRITICAL check in degraded mode - if cookies are
-        missing, the provider is disabled but startup continues.
+        missing, the provider is disabled but startup continues. The file
+        is read in a worker thread to keep the event loop responsive.
+
+        Returns:
+            ComponentCheckResult with cookie status.
+        """
+        return await asyncio.to_thread(self._check_cookies_sync)
+
+    def _check_cookies_sync(self) -> ComponentCheckResult:
+        """Blocking body of check_cookies.
 
         Returns:
             ComponentCheckResult with cookie status.
@@ -415,11 +617,8 @@ class StartupValidator:
         # Check YouTube provider cookie if enabled
         if not self.config.providers.youtube.enabled:
             logger.info("youtube_provider_disabled")
-            return ComponentCheckResult(
-                name="cookies",
-                passed=True,
-                critical=False,
-                message="YouTube provider is disabled, no cookie check needed",
+            return ComponentCheckResult.ok(
+                "cookies", False, message="YouTube provider is disabled, no cookie check needed"
             )
 
         cookie_path = self.config.providers.youtube.cookie_path
@@ -429,41 +628,34 @@ class StartupValidator:
 
         path = Path(cookie_path)
 
-        access_failure = self._check_cookie_access(path, cookie_path)
-        if access_failure is not None:
-            return access_failure
+        stat = self._stat_cookie_file(path, cookie_path)
+        if isinstance(stat, ComponentCheckResult):
+            return stat
+
+        cache_key = (cookie_path, self.detailed_cookies)
+        cached = _cookie_check_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            logger.debug("cookies_check_cached", path=cookie_path)
+            return _copy_result(cached[2])
 
         # Check if file is readable and valid
         try:
-            content = path.read_text()
-            if not content.strip():
+            valid_entries = self._count_cookie_entries(
+                path, stop_at_first=not self.detailed_cookies
+            )
+            if valid_entries is None:
                 logger.warning("youtube_cookie_empty", path=cookie_path)
                 return self._cookie_failure("Cookie file is empty")
 
-            # Basic Netscape format validation
-            lines = [
-                ln for ln in content.strip().split("\n") if ln.strip() and not ln.startswith("#")
-            ]
-            valid_entries = sum(1 for line in lines if len(line.split("\t")) == 7)
-
             if valid_entries == 0:
                 logger.warning("youtube_cookie_invalid_format", path=cookie_path)
                 return self._cookie_failure(
                     "Cookie file has invalid format (no valid Netscape entries)"
                 )
 
-            logger.info(
-                "cookies_check_passed",
-                path=cookie_path,
-                valid_entries=valid_entries,
-            )
-            return ComponentCheckResult(
-                name="cookies",
-                passed=True,
-                critical=False,
-                message="Cookie file is valid",
-                details={"path": cookie_path, "valid_entries": valid_entries},
-            )
+            result = self._cookie_success(cookie_path, valid_entries)
+            _cookie_check_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, result)
+            return _copy_result(result)
 
         except PermissionError:
             logger.error("youtube_cookie_permission_error", path=cookie_path)
@@ -487,6 +679,11 @@ class StartupValidator:
 
         config_file = config_dir / "config"
 
+        # The flag is never removed once present, so skip the file I/O on
+        # revalidation within this process
+        if str(config_file) in StartupValidator._configured_runtime_files:
+            return
+
         try:
             # Create directory if it doesn't exist
             config_dir.mkdir(parents=True, exist_ok=True)
@@ -507,6 +704,7 @@ class StartupValidator:
                         config_file=str(config_file),
                         runtimes=runtimes,
                     )
+                    StartupValidator._configured_runtime_files.add(str(config_file))
                     return
                 # Node not in existing runtimes - need to add it
                 logger.info(
@@ -515,13 +713,19 @@ class StartupValidator:
                     existing_runtimes=runtimes,
                 )
 
-            # Append the configuration
-            with config_file.open("a") as f:
-                if existing_content and not existing_content.endswith("\n"):
-                    f.write("\n")
-                f.write("# Added by yt-dlp-api for JavaScript challenge resolution\n")
-                f.write("--js-runtimes node\n")
+            # Append the configuration with a single write on an O_APPEND fd
+            payload = (
+                "# Added by yt-dlp-api for JavaScript challenge resolution\n" "--js-runtimes node\n"
+            )
+            if existing_content and not existing_content.endswith("\n"):
+                payload = "\n" + payload
+            fd = os.open(config_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                os.write(fd, payload.encode("utf-8"))
+            finally:
+                os.close(fd)
 
+            StartupValidator._configured_runtime_files.add(str(config_file))
             logger.info(
                 "ytdlp_runtime_configured",
                 config_file=str(config_file),
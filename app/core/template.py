@@ -4,9 +4,11 @@ This module provides secure template processing for downloaded file names,
 with path traversal prevention and filename sanitization.
 """
 
+import os
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, FrozenSet, Optional
 
@@ -15,7 +17,7 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateResult:
     """Result of template processing."""
 
@@ -30,15 +32,18 @@ class TemplateProcessor:
     # Characters illegal in filenames on Windows/Linux/Mac
     ILLEGAL_CHARS: FrozenSet[str] = frozenset('<>:"/\\|?*')
 
-    # Control characters (ASCII 0-31)
-    CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x1f]")
+    # One-pass translation: illegal characters become "_", control characters
+    # (ASCII 0-31, including the null byte) are removed
+    FILENAME_TRANSLATION = str.maketrans(
+        {**{char: "_" for char in ILLEGAL_CHARS}, **{chr(code): None for code in range(32)}}
+    )
+
+    # Any character FILENAME_TRANSLATION would change. A C-level search is much
+    # cheaper than translate, and most titles need no change at all.
+    UNSAFE_CHAR_PATTERN = re.compile("[\x00-\x1f" + re.escape("".join(sorted(ILLEGAL_CHARS))) + "]")
 
-    # Path traversal patterns
-    PATH_TRAVERSAL_PATTERNS = [
-        r"\.\./",  # Unix parent directory
-        r"\.\.\\",  # Windows parent directory
-        r"^\.\.$",  # Just ".."
-    ]
+    # Path traversal: Unix parent directory, Windows parent directory, or just ".."
+    PATH_TRAVERSAL_PATTERN = re.compile(r"\.\./|\.\.\\|^\.\.$", re.ASCII)
 
     # Default output template (yt-dlp style)
     DEFAULT_TEMPLATE = "%(title)s-%(id)s.%(ext)s"
@@ -82,6 +87,41 @@ class TemplateProcessor:
             output_dir: Base output directory for downloads
         """
         self.output_dir = output_dir or "/app/downloads"
+        self._output_path = Path(self.output_dir)
+
+    @cached_property
+    def _resolved_output_dir(self) -> Path:
+        """
+        Output directory with symlinks resolved, computed on first use.
+
+        Resolution stats every path component, so it is done once per
+        processor rather than per validated path. It is deferred rather than
+        done in __init__ because module-level processors are built at import,
+        before startup has created the directory.
+        """
+        return self._output_path.resolve()
+
+    @classmethod
+    def _is_windows_reserved(cls, filename: str) -> bool:
+        """
+        Check whether a filename's name part (before the last dot) is reserved on Windows.
+
+        Reserved names are 3 or 4 characters long, so longer names are rejected
+        without uppercasing or copying them.
+
+        Args:
+            filename: Filename to check
+
+        Returns:
+            True if the name part is a Windows reserved name
+        """
+        dot = filename.rfind(".")
+        stem_len = dot if dot >= 0 else len(filename)
+        if stem_len != 3 and stem_len != 4:
+            return False
+        stem = filename[:stem_len]
+        # Reserved names are ASCII; skip case mapping for anything else
+        return stem.isascii() and stem.upper() in cls.WINDOWS_RESERVED
 
     def sanitize_filename(self, filename: str) -> str:  # noqa: C901
         """
@@ -99,31 +139,27 @@ class TemplateProcessor:
         if not filename:
             return "unnamed"
 
-        # Normalize Unicode characters (NFKC normalization)
-        filename = unicodedata.normalize("NFKC", filename)
-
-        # Remove control characters
-        filename = self.CONTROL_CHAR_PATTERN.sub("", filename)
-
-        # Remove null bytes (security issue)
-        filename = filename.replace("\x00", "")
+        # Normalize Unicode characters (NFKC normalization). ASCII text is
+        # already NFKC-normalized, so the common case skips the table walk
+        if not filename.isascii():
+            filename = unicodedata.normalize("NFKC", filename)
 
-        # Replace illegal characters with underscore
-        for char in self.ILLEGAL_CHARS:
-            filename = filename.replace(char, "_")
+        # Remove control characters and null bytes (security issue), and replace
+        # illegal characters with underscore, in a single pass
+        if self.UNSAFE_CHAR_PATTERN.search(filename):
+            filename = filename.translate(self.FILENAME_TRANSLATION)
 
         # Remove leading/trailing whitespace and dots
         filename = filename.strip().strip(".")
 
         # Handle Windows reserved names
-        name_without_ext = filename.rsplit(".", 1)[0] if "." in filename else filename
-        if name_without_ext.upper() in self.WINDOWS_RESERVED:
+        if self._is_windows_reserved(filename):
             filename = f"_{filename}"
 
         # Truncate if too long (preserve extension)
         if len(filename) > self.MAX_FILENAME_LENGTH:
-            if "." in filename:
-                name, ext = filename.rsplit(".", 1)
+            name, sep, ext = filename.rpartition(".")
+            if sep:
                 max_name_len = self.MAX_FILENAME_LENGTH - len(ext) - 1
 
                 # If extension alone exceeds limit, truncate extension too
@@ -144,8 +180,7 @@ class TemplateProcessor:
 
             # Re-check Windows reserved names after truncation
             # Truncation might create a reserved name (e.g., "AUXabc" -> "AUX")
-            name_without_ext = filename.rsplit(".", 1)[0] if "." in filename else filename
-            if name_without_ext.upper() in self.WINDOWS_RESERVED:
+            if self._is_windows_reserved(filename):
                 filename = f"_{filename}"
                 # If this makes it too long, truncate again (preserving the underscore)
                 if len(filename) > self.MAX_FILENAME_LENGTH:
@@ -178,13 +213,12 @@ class TemplateProcessor:
             return TemplateResult(is_valid=False, error_message="Template cannot be empty")
 
         # Check for path traversal attempts
-        for pattern in self.PATH_TRAVERSAL_PATTERNS:
-            if re.search(pattern, template):
-                logger.warning("Path traversal detected in template", template=template)
-                return TemplateResult(
-                    is_valid=False,
-                    error_message="Template contains path traversal sequences",
-                )
+        if self.PATH_TRAVERSAL_PATTERN.search(template):
+            logger.warning("Path traversal detected in template", template=template)
+            return TemplateResult(
+                is_valid=False,
+                error_message="Template contains path traversal sequences",
+            )
 
         # Check for absolute paths
         if template.startswith("/") or (
@@ -220,7 +254,7 @@ class TemplateProcessor:
         try:
             # Resolve the path to catch symbolic links and normalize
             resolved_path = Path(path).resolve()
-            output_dir = Path(self.output_dir).resolve()
+            output_dir = self._resolved_output_dir
 
             # Check if path is within output directory
             try:
@@ -256,14 +290,19 @@ class TemplateProcessor:
         Returns:
             TemplateResult with processed filename
         """
-        # Validate template first
-        validation = self.validate_template(template)
-        if not validation.is_valid:
-            return validation
+        # The default template is a known-safe constant, so it skips validation
+        is_default = template == self.DEFAULT_TEMPLATE
+        if not is_default:
+            validation = self.validate_template(template)
+            if not validation.is_valid:
+                return validation
 
         try:
-            # Use Python's % formatting for yt-dlp style templates
-            processed = template % variables
+            if is_default:
+                processed = self._apply_default_template(variables)
+            else:
+                # Use Python's % formatting for yt-dlp style templates
+                processed = template % variables
         except KeyError as e:
             return TemplateResult(is_valid=False, error_message=f"Missing template variable: {e}")
         except ValueError as e:
@@ -279,6 +318,40 @@ class TemplateProcessor:
 
         return TemplateResult(is_valid=True, processed_path=processed)
 
+    @staticmethod
+    def _apply_default_template(variables: Dict[str, str]) -> str:
+        """
+        Format DEFAULT_TEMPLATE without parsing it.
+
+        Equivalent to ``DEFAULT_TEMPLATE % variables``, including the
+        KeyError raised for a missing variable.
+
+        Args:
+            variables: Dictionary of variable values
+
+        Returns:
+            Formatted filename
+        """
+        return f"{variables['title']!s}-{variables['id']!s}.{variables['ext']!s}"
+
+    @staticmethod
+    def _is_plain_name(filename: str) -> bool:
+        """
+        Check that a filename is a single path component.
+
+        Args:
+            filename: Filename to check
+
+        Returns:
+            True if the name has no separators, null bytes or dot segments
+        """
+        return (
+            filename not in ("", ".", "..")
+            and "/" not in filename
+            and "\\" not in filename
+            and "\x00" not in filename
+        )
+
     def get_unique_filename(self, directory: str, filename: str) -> str:
         """
         Generate a unique filename by adding numeric suffix if file exists.
@@ -299,20 +372,27 @@ class TemplateProcessor:
             return filename
 
         # Split filename and extension
-        if "." in filename:
-            name, ext = filename.rsplit(".", 1)
+        name, sep, ext = filename.rpartition(".")
+        if sep:
             ext = f".{ext}"
         else:
-            name = filename
-            ext = ""
+            name, ext = filename, ""
+
+        # On a collision, list the directory once and probe suffixes against
+        # the set of names, instead of one stat per candidate
+        try:
+            with os.scandir(directory) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
 
         # Find unique name with numeric suffix
         counter = 1
         while True:
             new_filename = f"{name}_{counter}{ext}"
-            new_path = Path(directory) / new_filename
 
-            if not new_path.exists():
+            # Confirm on disk in case the file appeared after the scan
+            if new_filename not in existing and not (Path(directory) / new_filename).exists():
                 logger.debug(
                     "Generated unique filename",
                     original=filename,
@@ -363,7 +443,13 @@ class TemplateProcessor:
                 return TemplateResult(is_valid=False, error_message=str(e))
 
         # Build full path
-        full_path = str(Path(self.output_dir) / filename)
+        output_path = self._output_path / filename
+        full_path = str(output_path)
+
+        # Fast path: a plain name that is not a symlink is a direct child of the
+        # output directory, so the resolve() walk cannot find an escape
+        if self._is_plain_name(filename) and not output_path.is_symlink():
+            return TemplateResult(is_valid=True, processed_path=full_path)
 
         # Validate the final path
         path_validation = self.validate_output_path(full_path)
@@ -5,6 +5,7 @@ parameters that are used across API endpoints.
 """
 
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from typing import FrozenSet, Optional, Set
@@ -32,7 +33,7 @@ class AudioQuality(str, Enum):
     HIGH = "320"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a validation operation."""
 
@@ -41,6 +42,24 @@ class ValidationResult:
     sanitized_value: Optional[str] = None
 
 
+# Failures with a fixed message; results are immutable, so one instance each
+# is shared instead of being rebuilt on every rejected request
+_URL_REQUIRED = ValidationResult(
+    is_valid=False, error_message="URL is required and must be a string"
+)
+_URL_EMPTY = ValidationResult(is_valid=False, error_message="URL cannot be empty")
+_URL_INVALID = ValidationResult(is_valid=False, error_message="Invalid URL format")
+_URL_BAD_SCHEME = ValidationResult(
+    is_valid=False, error_message="URL must use http or https scheme"
+)
+_URL_NO_DOMAIN = ValidationResult(is_valid=False, error_message="URL must include a valid domain")
+_FORMAT_ID_REQUIRED = ValidationResult(is_valid=False, error_message="Format ID is required")
+_FORMAT_ID_EMPTY = ValidationResult(is_valid=False, error_message="Format ID cannot be empty")
+_FORMAT_ID_INVALID = ValidationResult(
+    is_valid=False, error_message="Format ID contains invalid characters"
+)
+
+
 class URLValidator:
     """Validates URLs against an allowed domain whitelist."""
 
@@ -65,6 +84,16 @@ class URLValidator:
         }
     )
 
+    # Plain http(s) URL whose authority is a bare hostname: no credentials, port
+    # or unusual characters, so the host is exactly what urlparse would return
+    SIMPLE_URL_PATTERN = re.compile(r"https?://([a-z0-9.-]+)(?=[/?#]|$)", re.IGNORECASE | re.ASCII)
+
+    # Valid results memoized per validator; clients often send the same video
+    # URL for info, formats and download. Only URLs up to CACHE_MAX_URL_LENGTH
+    # are cached, so client-chosen strings cannot pin unbounded memory.
+    CACHE_SIZE = 2048
+    CACHE_MAX_URL_LENGTH = 2048
+
     def __init__(self, allowed_domains: Optional[Set[str]] = None):
         """
         Initialize URL validator.
@@ -72,11 +101,18 @@ class URLValidator:
         Args:
             allowed_domains: Set of allowed domain names. Uses default if not provided.
         """
-        self.allowed_domains = allowed_domains or self.DEFAULT_ALLOWED_DOMAINS
+        # Frozen so memoized results cannot go stale
+        self.allowed_domains: FrozenSet[str] = (
+            frozenset(allowed_domains) if allowed_domains else self.DEFAULT_ALLOWED_DOMAINS
+        )
+        self._cache: OrderedDict[str, ValidationResult] = OrderedDict()
 
-    def validate(self, url: str) -> ValidationResult:  # noqa: C901
+    def validate(self, url: str) -> ValidationResult:
         """Validate a URL against the whitelist.
 
+        Valid results for short URLs are cached per URL string; ValidationResult
+        is immutable, so the cached instance is returned as is.
+
         Args:
             url: URL to validate
 
@@ -84,19 +120,43 @@ class URLValidator:
             ValidationResult with validation status and any error message
         """
         if not url or not isinstance(url, str):
-            return ValidationResult(
-                is_valid=False, error_message="URL is required and must be a string"
-            )
+            return _URL_REQUIRED
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            self._cache.move_to_end(url)
+            return cached
+
+        result = self._validate(url)
+        if result.is_valid and len(url) <= self.CACHE_MAX_URL_LENGTH:
+            self._cache[url] = result
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
 
+    def _validate(self, url: str) -> ValidationResult:  # noqa: C901
+        """Validate a URL string against the whitelist, uncached.
+
+        Args:
+            url: Non-empty URL string to validate
+
+        Returns:
+            ValidationResult with validation status and any error message
+        """
         url = url.strip()
         if not url:
-            return ValidationResult(is_valid=False, error_message="URL cannot be empty")
+            return _URL_EMPTY
+
+        # Fast path for the common case; anything else takes the full parse
+        match = self.SIMPLE_URL_PATTERN.match(url)
+        if match:
+            return self._check_domain(url, match.group(1).lower())
 
         try:
             parsed = urlparse(url)
         except ValueError as e:
             logger.warning("URL parsing failed", url=url, error=str(e))
-            return ValidationResult(is_valid=False, error_message="Invalid URL format")
+            return _URL_INVALID
 
         # Check for dangerous schemes
         scheme = parsed.scheme.lower() if parsed.scheme else ""
@@ -108,9 +168,7 @@ class URLValidator:
 
         # Require http or https
         if scheme not in ("http", "https", ""):
-            return ValidationResult(
-                is_valid=False, error_message="URL must use http or https scheme"
-            )
+            return _URL_BAD_SCHEME
 
         # Extract and validate domain
         netloc = parsed.netloc.lower()
@@ -124,7 +182,7 @@ class URLValidator:
                     netloc = potential_domain
 
         if not netloc:
-            return ValidationResult(is_valid=False, error_message="URL must include a valid domain")
+            return _URL_NO_DOMAIN
 
         # Extract hostname using parsed.hostname to correctly handle
         # URLs with embedded credentials or port numbers
@@ -136,7 +194,19 @@ class URLValidator:
             # Fallback to netloc parsing if hostname is None (shouldn't happen with valid URLs)
             domain = netloc.split(":")[0].split("@")[-1]
 
-        # Check if domain is in whitelist
+        return self._check_domain(url, domain)
+
+    def _check_domain(self, url: str, domain: str) -> ValidationResult:
+        """
+        Check an extracted hostname against the whitelist.
+
+        Args:
+            url: Original URL (returned as the sanitized value)
+            domain: Lowercased hostname extracted from the URL
+
+        Returns:
+            ValidationResult with validation status and any error message
+        """
         if domain not in self.allowed_domains:
             logger.debug("Domain not in whitelist", url=url, domain=domain)
             return ValidationResult(
@@ -164,7 +234,7 @@ class FormatValidator:
     """Validates yt-dlp format IDs and specifications."""
 
     # Valid format ID pattern: alphanumeric, underscore, hyphen, plus (for merged formats)
-    FORMAT_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_+-]+$")
+    FORMAT_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_+-]+$", re.ASCII)
 
     # Maximum length for format ID
     MAX_FORMAT_ID_LENGTH = 50
@@ -195,11 +265,11 @@ class FormatValidator:
             ValidationResult with validation status
         """
         if not format_id or not isinstance(format_id, str):
-            return ValidationResult(is_valid=False, error_message="Format ID is required")
+            return _FORMAT_ID_REQUIRED
 
         format_id = format_id.strip()
         if not format_id:
-            return ValidationResult(is_valid=False, error_message="Format ID cannot be empty")
+            return _FORMAT_ID_EMPTY
 
         if len(format_id) > self.MAX_FORMAT_ID_LENGTH:
             return ValidationResult(
@@ -213,10 +283,7 @@ class FormatValidator:
 
         # Check pattern for standard format IDs
         if not self.FORMAT_ID_PATTERN.match(format_id):
-            return ValidationResult(
-                is_valid=False,
-                error_message="Format ID contains invalid characters",
-            )
+            return _FORMAT_ID_INVALID
 
         return ValidationResult(is_valid=True, sanitized_value=format_id)
 
@@ -228,6 +295,13 @@ class FormatValidator:
 class ParameterValidator:
     """Validates API request parameters."""
 
+    # Valid enum values, for hash lookups instead of Enum construction
+    AUDIO_FORMATS: FrozenSet[str] = frozenset(f.value for f in AudioFormat)
+    AUDIO_QUALITIES: FrozenSet[str] = frozenset(q.value for q in AudioQuality)
+
+    # ISO 639-1 (2 chars) or ISO 639-2 (3 chars), optionally with region (e.g., en-US)
+    LANG_CODE_PATTERN = re.compile(r"^[a-z]{2,3}(-[a-zA-Z]{2,4})?$", re.ASCII)
+
     def validate_audio_format(self, audio_format: str) -> ValidationResult:
         """
         Validate audio format parameter.
@@ -241,15 +315,15 @@ class ParameterValidator:
         if not audio_format:
             return ValidationResult(is_valid=False, error_message="Audio format is required")
 
-        try:
-            AudioFormat(audio_format.lower())
-            return ValidationResult(is_valid=True, sanitized_value=audio_format.lower())
-        except ValueError:
-            valid_formats = [f.value for f in AudioFormat]
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"Invalid audio format. Valid options: {', '.join(valid_formats)}",
-            )
+        audio_format = audio_format.lower()
+        if audio_format in self.AUDIO_FORMATS:
+            return ValidationResult(is_valid=True, sanitized_value=audio_format)
+
+        valid_formats = [f.value for f in AudioFormat]
+        return ValidationResult(
+            is_valid=False,
+            error_message=f"Invalid audio format. Valid options: {', '.join(valid_formats)}",
+        )
 
     def validate_audio_quality(self, quality: str) -> ValidationResult:
         """
@@ -264,15 +338,14 @@ class ParameterValidator:
         if not quality:
             return ValidationResult(is_valid=False, error_message="Audio quality is required")
 
-        try:
-            AudioQuality(quality)
+        if quality in self.AUDIO_QUALITIES:
             return ValidationResult(is_valid=True, sanitized_value=quality)
-        except ValueError:
-            valid_qualities = [f.value for f in AudioQuality]
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"Invalid audio quality. Valid options: {', '.join(valid_qualities)}kbps",
-            )
+
+        valid_qualities = [f.value for f in AudioQuality]
+        return ValidationResult(
+            is_valid=False,
+            error_message=f"Invalid audio quality. Valid options: {', '.join(valid_qualities)}kbps",
+        )
 
     def validate_language_code(self, lang_code: str) -> ValidationResult:
         """
@@ -289,10 +362,7 @@ class ParameterValidator:
 
         lang_code = lang_code.strip().lower()
 
-        # ISO 639-1 (2 chars) or ISO 639-2 (3 chars), optionally with region (e.g., en-US)
-        pattern = re.compile(r"^[a-z]{2,3}(-[a-zA-Z]{2,4})?$")
-
-        if not pattern.match(lang_code):
+        if not self.LANG_CODE_PATTERN.match(lang_code):
             return ValidationResult(
                 is_valid=False,
                 error_message="Invalid language code format. Use ISO 639 format (e.g., 'en', 'en-US')",
@@ -314,7 +384,9 @@ class ParameterValidator:
         Returns:
             ValidationResult with validation status
         """
-        if not isinstance(value, int) or isinstance(value, bool):
+        # Exact type check: rejects bool (an int subclass) in one comparison,
+        # and other int subclasses along with it
+        if type(value) is not int:
             return ValidationResult(is_valid=False, error_message=f"{name} must be an integer")
 
         if value <= 0:
@@ -5,16 +5,14 @@ Implements requirements 12, 16, 19, 20, 29, 39, and 46.
 """
 
 import asyncio
-import contextlib
-import time
 from contextlib import asynccontextmanager
+from time import perf_counter
 from typing import AsyncGenerator
 
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app import __version__
 from app.api import admin, download, health, jobs, metrics, transcript, video
@@ -38,32 +36,53 @@ from app.services.webhook_service import configure_webhook_service
 logger = structlog.get_logger(__name__)
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """Middleware to track HTTP request metrics.
 
     Records request count and duration for all endpoints,
     using FastAPI route templates to normalize paths.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware: it only needs
+    the response status, so it wraps ``send`` instead of building Request
+    and Response objects and running the app in a separate task.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize metrics middleware.
+
+        Args:
+            app: The ASGI application
+        """
+        self.app = app
+        self._record_request = MetricsCollector.record_request
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and record metrics."""
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
-
-        # Use FastAPI route template for normalized endpoint path
-        # Use fixed label for unmatched routes to prevent unbounded cardinality
-        route = request.scope.get("route")
-        endpoint = route.path if route else "/unmatched"
-
-        MetricsCollector.record_request(
-            method=request.method,
-            endpoint=endpoint,
-            status=response.status_code,
-            duration=duration,
-        )
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reported if the app fails before starting a response
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start_time = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = perf_counter() - start_time
 
-        return response
+            # Use FastAPI route template for normalized endpoint path
+            # Use fixed label for unmatched routes to prevent unbounded cardinality
+            route = scope.get("route")
+            endpoint = route.path if route else "/unmatched"
+
+            self._record_request(scope["method"], endpoint, status, duration)
 
 
 # Global service instances
@@ -73,6 +92,24 @@ _cleanup_task: asyncio.Task | None = None
 _disabled_providers: list[str] = []
 
 
+def _log_background_task_exit(task: asyncio.Task) -> None:
+    """Log a background task that ended with an exception.
+
+    Attached as a done callback, so a crash is reported when it happens
+    rather than surfacing (or being lost) at shutdown.
+    """
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(
+            "Background task failed",
+            task=task.get_name(),
+            error=str(exc),
+            exc_info=exc,
+        )
+
+
 def get_provider_manager() -> ProviderManager:
     """Get the global provider manager instance."""
     if _provider_manager is None:
@@ -226,7 +263,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Start cleanup scheduler in background
     from app.services.storage import cleanup_scheduler
 
-    _cleanup_task = asyncio.create_task(cleanup_scheduler(storage, interval=3600))
+    _cleanup_task = asyncio.create_task(
+        cleanup_scheduler(storage, interval=3600), name="cleanup_scheduler"
+    )
+    _cleanup_task.add_done_callback(_log_background_task_exit)
     logger.info("Cleanup scheduler started")
 
     logger.info("Application startup complete", version=__version__)
@@ -236,11 +276,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Application shutting down")
 
-    # Stop cleanup scheduler
+    # Stop cleanup scheduler. wait() never re-raises the task's exception, so
+    # a scheduler that already crashed (and was logged) cannot abort shutdown
+    # before the worker is stopped.
     if _cleanup_task:
         _cleanup_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await _cleanup_task
+        await asyncio.wait([_cleanup_task])
 
     # Stop download worker
     await worker.stop()
@@ -336,7 +377,8 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Add metrics middleware (before rate limiting to capture all requests)
+    # Add metrics middleware. It sits inside rate limiting (added below, so
+    # outermost): 429s never reach it and are counted by rate_limit_exceeded_total
     app.add_middleware(MetricsMiddleware)
 
     # Add rate limiting middleware
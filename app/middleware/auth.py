@@ -4,12 +4,12 @@ This module provides API key authentication for protected endpoints.
 """
 
 import hashlib
-import hmac
 from typing import Callable, FrozenSet, List, Optional, Set
 
 import structlog
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader
+from starlette.types import Scope
 
 logger = structlog.get_logger(__name__)
 
@@ -35,6 +35,23 @@ def hash_api_key(api_key: Optional[str]) -> str:
     return f"sha256:{hashlib.sha256(api_key.encode()).hexdigest()[:8]}"
 
 
+def client_host(scope: Scope) -> str:
+    """
+    Get the client address of a connection for logging.
+
+    Reads the ASGI scope directly rather than through ``Request.client``,
+    which builds an Address tuple on every access.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        Client host, or "unknown" if the server did not provide one
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
 class APIKeyAuth:
     """API key authentication handler.
 
@@ -68,10 +85,22 @@ class APIKeyAuth:
             excluded_paths: Paths that don't require authentication.
         """
         self._api_keys: Set[str] = set(api_keys) if api_keys else set()
+        # Keys are matched by SHA-256 digest: one set probe regardless of how
+        # many keys are configured, and lookup timing depends only on the
+        # digest, which a caller cannot steer towards a valid key
+        self._api_key_digests: FrozenSet[bytes] = frozenset(
+            hashlib.sha256(key.encode()).digest() for key in self._api_keys
+        )
         # Use 'is None' to allow explicit empty set
-        self._excluded_paths = (
-            excluded_paths if excluded_paths is not None else self.DEFAULT_EXCLUDED_PATHS
+        self._excluded_paths: FrozenSet[str] = (
+            frozenset(excluded_paths) if excluded_paths is not None else self.DEFAULT_EXCLUDED_PATHS
+        )
+        # Normalized once so each check is a set lookup plus one C-level
+        # startswith over all prefixes
+        self._excluded_exact: FrozenSet[str] = frozenset(
+            p.rstrip("/") or "/" for p in self._excluded_paths
         )
+        self._excluded_prefixes = tuple(f"{p}/" for p in self._excluded_exact)
         self._allow_all = len(self._api_keys) == 0
 
         if self._allow_all:
@@ -92,9 +121,9 @@ class APIKeyAuth:
         return self._api_keys
 
     @property
-    def excluded_paths(self) -> Set[str]:
+    def excluded_paths(self) -> FrozenSet[str]:
         """Get the set of excluded paths."""
-        return set(self._excluded_paths)
+        return self._excluded_paths
 
     @property
     def allow_all(self) -> bool:
@@ -118,9 +147,7 @@ class APIKeyAuth:
 
         # Check for exact match or prefix match (e.g. /docs matching /docs/subpath).
         # This is safer to avoid partial matches (e.g. /admin matching /admin_secret).
-        return any(
-            path == excluded or path.startswith(excluded + "/") for excluded in self._excluded_paths
-        )
+        return path in self._excluded_exact or path.startswith(self._excluded_prefixes)
 
     def validate_api_key(self, api_key: Optional[str]) -> bool:
         """
@@ -137,7 +164,7 @@ class APIKeyAuth:
         if not api_key:
             return False
 
-        return any(hmac.compare_digest(api_key, valid_key) for valid_key in self._api_keys)
+        return hashlib.sha256(api_key.encode()).digest() in self._api_key_digests
 
     def authenticate(self, request: Request, api_key: Optional[str]) -> bool:
         """
@@ -177,7 +204,7 @@ class APIKeyAuth:
             "API key authentication failed",
             path=path,
             key_hash=hash_api_key(api_key) if api_key else "none",
-            client_ip=request.client.host if request.client else "unknown",
+            client_ip=client_host(request.scope),
         )
 
         raise HTTPException(
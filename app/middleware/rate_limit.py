@@ -4,28 +4,27 @@ This module provides HTTP middleware for enforcing rate limits on API requests.
 Satisfies Requirement 27: Rate Limiting.
 """
 
-from typing import Callable, FrozenSet, Optional
+import json
+from typing import Callable, Dict, FrozenSet, Optional
 
 import structlog
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.rate_limiter import RateLimiter, get_rate_limiter
-from app.middleware.auth import hash_api_key
+from app.middleware.auth import client_host, hash_api_key
 
 logger = structlog.get_logger(__name__)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """HTTP middleware for rate limiting API requests.
 
     This middleware checks each request against the rate limiter and returns
     HTTP 429 with Retry-After header when limits are exceeded.
 
-    Excluded paths (health checks, docs, etc.) are not rate limited.
+    Excluded paths (health checks, docs, etc.) are not rate limited. Written
+    as plain ASGI: it only reads the path and one header, so allowed requests
+    are passed on untouched instead of through BaseHTTPMiddleware's task.
     """
 
     # Paths that don't require rate limiting
@@ -54,12 +53,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             rate_limiter: RateLimiter instance. Uses global instance if not provided.
             excluded_paths: Paths to exclude from rate limiting.
         """
-        super().__init__(app)
+        self.app = app
         self.rate_limiter = rate_limiter or get_rate_limiter()
+        # Bound once; the limiter is configured in place, never replaced
+        self._get_category = self.rate_limiter.get_endpoint_category
+        self._check_rate_limit = self.rate_limiter.check_rate_limit
+        # Encoded 429 body up to the retry_after value, per category
+        self._rejection_prefixes: Dict[str, bytes] = {}
         # Use 'is None' to allow explicit empty frozenset (rate limit all paths)
         self.excluded_paths = (
             excluded_paths if excluded_paths is not None else self.DEFAULT_EXCLUDED_PATHS
         )
+        # Normalized once so each check is a set lookup plus one C-level
+        # startswith over all prefixes
+        self._excluded_exact: FrozenSet[str] = frozenset(
+            p.rstrip("/") or "/" for p in self.excluded_paths
+        )
+        self._excluded_prefixes = tuple(f"{p}/" for p in self._excluded_exact)
 
     def _is_excluded_path(self, path: str) -> bool:
         """Check if path should be excluded from rate limiting.
@@ -77,42 +87,79 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Exact match or proper subpath match (e.g. /docs matches /docs/subpath)
         # Avoids partial matches like /docs matching /docs-admin
-        return any(
-            normalized == excluded or normalized.startswith(excluded + "/")
-            for excluded in self.excluded_paths
-        )
+        return normalized in self._excluded_exact or normalized.startswith(self._excluded_prefixes)
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Process request through rate limiting.
+    async def _send_rate_limited(self, send: Send, category: str, retry_after: float) -> None:
+        """Send a 429 response for a rejected request.
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware/handler in chain
+        Rejections are the requests that arrive in floods, so the JSON body
+        is assembled from a pre-encoded per-category prefix rather than a
+        JSONResponse. The bytes match what JSONResponse would render.
 
-        Returns:
-            Response from next handler or 429 if rate limited
+        Args:
+            send: The ASGI send channel
+            category: Rate limit category that was exceeded
+            retry_after: Seconds until a token is available
         """
-        path = request.url.path
-
-        # Skip excluded paths
-        if self._is_excluded_path(path):
-            return await call_next(request)
+        prefix = self._rejection_prefixes.get(category)
+        if prefix is None:
+            head = json.dumps(
+                {
+                    "error_code": "RATE_LIMIT_EXCEEDED",
+                    "message": f"Rate limit exceeded for {category} operations",
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            prefix = (head[:-1] + ',"retry_after":').encode()
+            self._rejection_prefixes[category] = prefix
+
+        body = prefix + json.dumps(retry_after).encode() + b"}"
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"retry-after", str(int(retry_after) + 1).encode()),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"content-type", b"application/json"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
 
-        # Get category for this endpoint
-        category = self.rate_limiter.get_endpoint_category(path)
-        if category is None:
-            # Path not configured for rate limiting
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request through rate limiting.
 
-        # Get API key from header (use "anonymous" if not provided)
-        api_key = request.headers.get("X-API-Key", "anonymous")
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+
+        # Get category for this endpoint. Most paths have none, so this runs
+        # before the exclusion check and usually settles the request alone.
+        category = self._get_category(path)
+        if category is None or self._is_excluded_path(path):
+            # Path not configured for rate limiting, or explicitly excluded
+            await self.app(scope, receive, send)
+            return
+
+        # Get API key from header (use "anonymous" if not provided). ASGI header
+        # names are already lowercase bytes, so scan the raw list directly.
+        api_key = "anonymous"
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value.decode("latin-1")
+                break
 
         # Check rate limit
-        allowed, retry_after = await self.rate_limiter.check_rate_limit(api_key, category)
+        allowed, retry_after = await self._check_rate_limit(api_key, category)
 
         if not allowed:
             # Log rate limit exceeded
@@ -122,22 +169,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 category=category,
                 api_key_hash=hash_api_key(api_key),
                 retry_after=retry_after,
-                client_ip=request.client.host if request.client else "unknown",
+                client_ip=client_host(scope),
             )
 
             # Return 429 Too Many Requests
-            return JSONResponse(
-                status_code=429,
-                headers={"Retry-After": str(int(retry_after) + 1)},
-                content={
-                    "error_code": "RATE_LIMIT_EXCEEDED",
-                    "message": f"Rate limit exceeded for {category} operations",
-                    "retry_after": retry_after,
-                },
-            )
+            await self._send_rate_limited(send, category, retry_after)
+            return
 
         # Process request
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def create_rate_limit_middleware(
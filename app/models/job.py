@@ -28,7 +28,7 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents an asynchronous download job.
 
@@ -62,6 +62,8 @@ class Job:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for API responses."""
+        started_at = self.started_at
+        completed_at = self.completed_at
         return {
             "job_id": self.job_id,
             "status": self.status.value,
@@ -73,7 +75,7 @@ class Job:
             "file_size": self.file_size,
             "duration": self.duration,
             "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": started_at.isoformat() if started_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
             "queue_position": self.queue_position,
         }
@@ -1,7 +1,7 @@
 """Abstract base class for video providers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional, Pattern, Tuple
 
 from app.models.video import DownloadResult, VideoFormat
 from app.providers.exceptions import ProviderError
@@ -10,18 +10,27 @@ from app.providers.exceptions import ProviderError
 class VideoProvider(ABC):
     """Abstract base class for video platform providers."""
 
-    @abstractmethod
+    # Compiled URL patterns accepted by the default validate_url. For providers
+    # that keep the default, ProviderManager matches them inline; an overridden
+    # validate_url is always called.
+    url_patterns: ClassVar[Tuple[Pattern[str], ...]] = ()
+
     def validate_url(self, url: str) -> bool:
         """
         Validate if URL belongs to this provider.
 
+        The default accepts URLs matching one of the declared url_patterns;
+        providers that need more than a regex check override it.
+
         Args:
             url: Video URL to validate
 
         Returns:
             True if URL is valid for this provider, False otherwise
         """
-        pass
+        if not url:
+            return False
+        return any(pattern.match(url) for pattern in self.url_patterns)
 
     @abstractmethod
     async def get_info(
@@ -1,6 +1,7 @@
 """Provider manager for registration and selection."""
 
-from typing import Any, Callable, Dict, Optional
+import logging
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple
 
 import structlog
 
@@ -8,6 +9,9 @@ from app.providers.base import VideoProvider
 from app.providers.exceptions import InvalidURLError, ProviderError
 
 logger = structlog.get_logger(__name__)
+# structlog runs its processor chain before the stdlib level check, so the
+# per-selection debug events are gated on the underlying stdlib logger
+_stdlib_logger = logging.getLogger(__name__)
 
 
 class ProviderManager:
@@ -17,6 +21,10 @@ class ProviderManager:
         """Initialize the provider manager."""
         self._providers: Dict[str, VideoProvider] = {}
         self._enabled_providers: Dict[str, bool] = {}
+        # Enabled providers in registration order, with their declared URL
+        # patterns; rebuilt on every registry change so selection iterates a
+        # flat tuple
+        self._active: Tuple[Tuple[str, VideoProvider, Tuple[Pattern[str], ...]], ...] = ()
 
     def register_provider(self, name: str, provider: VideoProvider, enabled: bool = True) -> None:
         """
@@ -29,6 +37,7 @@ class ProviderManager:
         """
         self._providers[name] = provider
         self._enabled_providers[name] = enabled
+        self._registry_changed()
 
         logger.info("Provider registered", provider=name, enabled=enabled)
 
@@ -46,6 +55,7 @@ class ProviderManager:
             raise ValueError(f"Provider '{name}' is not registered")
 
         self._enabled_providers[name] = True
+        self._registry_changed()
         logger.info("Provider enabled", provider=name)
 
     def disable_provider(self, name: str) -> None:
@@ -62,8 +72,35 @@ class ProviderManager:
             raise ValueError(f"Provider '{name}' is not registered")
 
         self._enabled_providers[name] = False
+        self._registry_changed()
         logger.info("Provider disabled", provider=name)
 
+    def _registry_changed(self) -> None:
+        """Rebuild the active provider tuple."""
+        self._active = tuple(
+            (name, provider, self._inline_patterns(provider))
+            for name, provider in self._providers.items()
+            if self._enabled_providers[name]
+        )
+
+    @staticmethod
+    def _inline_patterns(provider: VideoProvider) -> Tuple[Pattern[str], ...]:
+        """
+        Return the URL patterns the manager may match in place of validate_url.
+
+        Only providers keeping the default VideoProvider.validate_url qualify;
+        an override may accept a different set of URLs and is always called.
+
+        Args:
+            provider: Provider instance
+
+        Returns:
+            The provider's url_patterns, or an empty tuple
+        """
+        if type(provider).validate_url is VideoProvider.validate_url:
+            return provider.url_patterns
+        return ()
+
     def is_provider_enabled(self, name: str) -> bool:
         """
         Check if a provider is enabled.
@@ -89,14 +126,11 @@ class ProviderManager:
         Raises:
             InvalidURLError: If no provider can handle the URL
         """
-        for name, provider in self._providers.items():
-            # Skip disabled providers
-            if not self._enabled_providers.get(name, False):
-                continue
-
+        for name, provider, patterns in self._active:
             try:
-                if provider.validate_url(url):
-                    logger.debug("Provider selected for URL", provider=name, url=url)
+                if self._accepts(provider, patterns, url):
+                    if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Provider selected for URL", provider=name, url=url)
                     return provider
             except Exception as e:
                 # Isolate provider errors - don't let one provider's
@@ -110,6 +144,26 @@ class ProviderManager:
             "Ensure the URL is from a supported platform and the provider is enabled."
         )
 
+    @staticmethod
+    def _accepts(provider: VideoProvider, patterns: Tuple[Pattern[str], ...], url: str) -> bool:
+        """
+        Check whether a provider accepts a URL.
+
+        Inline patterns are matched directly, skipping the validate_url
+        method call.
+
+        Args:
+            provider: Provider instance
+            patterns: Patterns to match inline (empty to call validate_url)
+            url: Video URL
+
+        Returns:
+            True if the provider accepts the URL
+        """
+        if patterns:
+            return any(pattern.match(url) for pattern in patterns)
+        return provider.validate_url(url)
+
     def get_provider_by_name(self, name: str) -> Optional[VideoProvider]:
         """
         Get a provider by name.
@@ -151,16 +205,21 @@ class ProviderManager:
         Raises:
             ProviderError: If operation fails
         """
+        # Callables such as functools.partial have no __name__
+        op_name = getattr(operation, "__name__", repr(operation))
+        debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug(
-                "Executing provider operation", provider=provider_name, operation=operation.__name__
-            )
+            if debug:
+                logger.debug(
+                    "Executing provider operation", provider=provider_name, operation=op_name
+                )
 
             result = await operation(*args, **kwargs)
 
-            logger.debug(
-                "Provider operation completed", provider=provider_name, operation=operation.__name__
-            )
+            if debug:
+                logger.debug(
+                    "Provider operation completed", provider=provider_name, operation=op_name
+                )
 
             return result
 
@@ -173,7 +232,7 @@ class ProviderManager:
             logger.error(
                 "Provider operation failed with unexpected error",
                 provider=provider_name,
-                operation=operation.__name__,
+                operation=op_name,
                 error=str(e),
                 exc_info=True,
             )
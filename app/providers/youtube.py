@@ -7,7 +7,7 @@ import re
 import subprocess  # nosec B404 - subprocess used for returning CompletedProcess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -24,6 +24,10 @@ from app.utils.transcript import parse_vtt
 
 logger = structlog.get_logger(__name__)
 
+# Resolution parsing for format sorting (e.g. "1920x1080", or a bare "720")
+_RESOLUTION_RE = re.compile(r"(\d+)x(\d+)")
+_NUMBER_RE = re.compile(r"(\d+)")
+
 
 def _is_test_mode() -> bool:
     """Check if test mode is enabled via environment variable."""
@@ -33,17 +37,18 @@ def _is_test_mode() -> bool:
 class YouTubeProvider(VideoProvider):
     """YouTube video provider implementation."""
 
-    # URL patterns for YouTube videos
+    # URL patterns for YouTube videos; each captures the video ID
     URL_PATTERNS = [
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+",
-        r"(?:https?://)?youtu\.be/[\w-]+",
-        r"(?:https?://)?m\.youtube\.com/watch\?v=[\w-]+",
+        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([\w-]+)",
+        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([\w-]+)",
+        r"(?:https?://)?(?:www\.)?youtube\.com/embed/([\w-]+)",
+        r"(?:https?://)?youtu\.be/([\w-]+)",
+        r"(?:https?://)?m\.youtube\.com/watch\?v=([\w-]+)",
     ]
 
-    # Pattern to extract video ID
-    VIDEO_ID_PATTERN = r"(?:v=|shorts/|embed/|youtu\.be/)([\w-]+)"
+    # All URL patterns as one alternation, so validation is a single match()
+    _url_re = re.compile("|".join(f"(?:{pattern})" for pattern in URL_PATTERNS), re.IGNORECASE)
+    url_patterns = (_url_re,)
 
     def __init__(self, config: dict, cookie_service: Optional[Any] = None):
         """
@@ -58,6 +63,8 @@ class YouTubeProvider(VideoProvider):
         self.retry_attempts: int = config.get("retry_attempts", 3)
         self.retry_backoff: list = config.get("retry_backoff", [2, 4, 8])
         self.cookie_service = cookie_service
+        # In-flight metadata runs keyed by (url, include_formats, include_subtitles)
+        self._info_inflight: Dict[Tuple[str, bool, bool], "asyncio.Future[Dict]"] = {}
 
         # Capture test mode at construction time (env var may not be visible in async context)
         self._test_mode = _is_test_mode()
@@ -73,47 +80,38 @@ class YouTubeProvider(VideoProvider):
             retry_attempts=self.retry_attempts,
         )
 
-    def validate_url(self, url: str) -> bool:
+    def extract_video_id(self, url: str) -> Optional[str]:
         """
-        Validate if URL is a valid YouTube URL.
+        Extract video ID from YouTube URL.
 
         Args:
-            url: URL to validate
+            url: YouTube URL
 
         Returns:
-            True if URL is valid YouTube URL, False otherwise
+            Video ID if the URL is a valid YouTube URL, None otherwise
         """
-        if not url:
-            return False
-
-        # Check against all URL patterns
-        for pattern in self.URL_PATTERNS:
-            if re.match(pattern, url, re.IGNORECASE):
-                logger.debug("URL validated", url=url, pattern=pattern)
-                return True
-
-        return False
+        return self._parse_url(url)
 
-    def extract_video_id(self, url: str) -> Optional[str]:
+    def _parse_url(self, url: str) -> Optional[str]:
         """
-        Extract video ID from YouTube URL.
+        Validate a YouTube URL and extract its video ID in one match.
 
         Args:
-            url: YouTube URL
+            url: URL to parse
 
         Returns:
-            Video ID if found, None otherwise
+            Video ID if the URL is a valid YouTube URL, None otherwise
         """
-        match = re.search(self.VIDEO_ID_PATTERN, url)
-        if match:
-            video_id = match.group(1)
-            logger.debug("Video ID extracted", url=url, video_id=video_id)
-            return video_id
-
-        logger.warning("Could not extract video ID", url=url)
-        return None
+        if not url:
+            return None
+        match = self._url_re.match(url)
+        if match is None or match.lastindex is None:
+            return None
+        # Exactly one alternative matched; its capture group is the last one set
+        video_id: str = match[match.lastindex]
+        return video_id
 
-    async def get_info(  # noqa: C901
+    async def get_info(
         self, url: str, include_formats: bool = False, include_subtitles: bool = False
     ) -> Dict:
         """
@@ -131,17 +129,78 @@ class YouTubeProvider(VideoProvider):
             InvalidURLError: If URL is invalid
             VideoUnavailableError: If video is not accessible
         """
-        if not self.validate_url(url):
+        video_id = self._parse_url(url)
+        if video_id is None:
             raise InvalidURLError(f"Invalid YouTube URL: {url}")
 
-        video_id = self.extract_video_id(url)
-        if not video_id:
-            raise InvalidURLError(f"Could not extract video ID from URL: {url}")
+        return await self._get_info(url, video_id, include_formats, include_subtitles)
+
+    async def _get_info(
+        self, url: str, video_id: str, include_formats: bool, include_subtitles: bool
+    ) -> Dict:
+        """
+        Extract video metadata for an already parsed URL.
+
+        Args:
+            url: YouTube video URL
+            video_id: Video ID parsed from the URL
+            include_formats: Whether to include format list
+            include_subtitles: Whether to include subtitle list
+
+        Returns:
+            Dictionary containing video information
 
+        Raises:
+            VideoUnavailableError: If video is not accessible
+        """
         # Validate cookie before execution
         if self.cookie_service:
             await self.cookie_service.validate_cookie("youtube")
 
+        # Concurrent requests for the same video share one yt-dlp run
+        key = (url, include_formats, include_subtitles)
+        task = self._info_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_info(url, video_id, include_formats, include_subtitles)
+            )
+            self._info_inflight[key] = task
+            task.add_done_callback(lambda done: self._info_finished(key, done))
+        # Shielded so a cancelled caller does not cancel the run for the others
+        return await asyncio.shield(task)
+
+    def _info_finished(self, key: Tuple[str, bool, bool], task: "asyncio.Future[Dict]") -> None:
+        """
+        Drop a finished info run from the in-flight map.
+
+        Args:
+            key: In-flight key of the run
+            task: The finished run
+        """
+        self._info_inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved when every caller was cancelled
+            task.exception()
+
+    async def _fetch_info(
+        self, url: str, video_id: str, include_formats: bool, include_subtitles: bool
+    ) -> Dict:
+        """
+        Run yt-dlp to extract video metadata.
+
+        Args:
+            url: YouTube video URL
+            video_id: Video ID extracted from the URL
+            include_formats: Whether to include format list
+            include_subtitles: Whether to include subtitle list
+
+        Returns:
+            Dictionary containing video information
+
+        Raises:
+            VideoUnavailableError: If video is not accessible
+            DownloadError: If yt-dlp fails or its output cannot be parsed
+        """
         logger.info(
             "Getting video info",
             url=url,
@@ -169,8 +228,9 @@ class YouTubeProvider(VideoProvider):
             result = await self._execute_with_retry(cmd, timeout=10.0)
             stdout = result.stdout
 
-            # Parse JSON output
-            info = json.loads(stdout.decode())
+            # Parse JSON output straight from bytes. Stdlib json on purpose:
+            # yt-dlp may emit NaN/Infinity, which strict parsers (orjson) reject
+            info = json.loads(stdout)
 
             # Transform to our format
             video_info: Dict = {
@@ -302,17 +362,14 @@ class YouTubeProvider(VideoProvider):
             InvalidURLError: If URL is invalid
             VideoUnavailableError: If video is not accessible
         """
-        if not self.validate_url(url):
+        video_id = self._parse_url(url)
+        if video_id is None:
             raise InvalidURLError(f"Invalid YouTube URL: {url}")
 
-        video_id = self.extract_video_id(url)
-        if not video_id:
-            raise InvalidURLError(f"Could not extract video ID from URL: {url}")
-
         logger.info("Listing formats", url=url, video_id=video_id)
 
         # Get video info with formats
-        info = await self.get_info(url, include_formats=True, include_subtitles=False)
+        info = await self._get_info(url, video_id, include_formats=True, include_subtitles=False)
 
         # Extract and convert formats
         formats_data = info.get("formats", [])
@@ -359,12 +416,12 @@ class YouTubeProvider(VideoProvider):
             return 0
 
         # Extract height from resolution (e.g., "1920x1080" -> 1080)
-        match = re.search(r"(\d+)x(\d+)", resolution)
+        match = _RESOLUTION_RE.search(resolution)
         if match:
             return int(match.group(2))  # Return height
 
         # Try to extract any number
-        match = re.search(r"(\d+)", resolution)
+        match = _NUMBER_RE.search(resolution)
         if match:
             return int(match.group(1))
 
@@ -391,13 +448,10 @@ class YouTubeProvider(VideoProvider):
             InvalidURLError: If URL is invalid
             TranscriptNotFoundError: If no transcript exists for the language
         """
-        if not self.validate_url(url):
+        video_id = self._parse_url(url)
+        if video_id is None:
             raise InvalidURLError(f"Invalid YouTube URL: {url}")
 
-        video_id = self.extract_video_id(url)
-        if not video_id:
-            raise InvalidURLError(f"Could not extract video ID from URL: {url}")
-
         # Validate cookie before execution
         if self.cookie_service:
             await self.cookie_service.validate_cookie("youtube")
@@ -488,13 +542,10 @@ class YouTubeProvider(VideoProvider):
             InvalidURLError: If URL is invalid
             DownloadError: If download fails
         """
-        if not self.validate_url(url):
+        video_id = self._parse_url(url)
+        if video_id is None:
             raise InvalidURLError(f"Invalid YouTube URL: {url}")
 
-        video_id = self.extract_video_id(url)
-        if not video_id:
-            raise InvalidURLError(f"Could not extract video ID from URL: {url}")
-
         # Validate cookie before execution
         if self.cookie_service:
             await self.cookie_service.validate_cookie("youtube")
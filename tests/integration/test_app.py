@@ -690,6 +690,41 @@ class TestApplicationLifecycle:
         assert "Error Codes" in API_DESCRIPTION
         assert "Authentication" in API_DESCRIPTION
 
+    @pytest.mark.asyncio
+    async def test_background_task_failure_is_logged(self) -> None:
+        """Test a crashed background task is logged when it ends."""
+        import asyncio
+
+        from app.main import _log_background_task_exit
+
+        async def crash() -> None:
+            raise OSError("disk gone")
+
+        task = asyncio.create_task(crash(), name="cleanup_scheduler")
+        await asyncio.wait([task])
+
+        with patch("app.main.logger") as mock_logger:
+            _log_background_task_exit(task)
+
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.kwargs["task"] == "cleanup_scheduler"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_background_task_not_logged(self) -> None:
+        """Test a task cancelled at shutdown is not reported as a failure."""
+        import asyncio
+
+        from app.main import _log_background_task_exit
+
+        task = asyncio.create_task(asyncio.sleep(3600))
+        task.cancel()
+        await asyncio.wait([task])
+
+        with patch("app.main.logger") as mock_logger:
+            _log_background_task_exit(task)
+
+        mock_logger.error.assert_not_called()
+
     def test_openapi_schema_includes_metadata(self, test_app: FastAPI) -> None:
         """Test that OpenAPI schema includes proper metadata."""
         client = TestClient(test_app)
@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from app.middleware.auth import (
     APIKeyAuth,
+    client_host,
     configure_auth,
     create_auth_dependency,
     get_auth,
@@ -43,6 +44,19 @@ class TestHashApiKey:
         assert hash_api_key(None) == "empty"
 
 
+class TestClientHost:
+    """Tests for client address lookup."""
+
+    def test_client_host_from_scope(self):
+        """Test the host is taken from the scope's client tuple."""
+        assert client_host({"client": ("10.0.0.5", 51234)}) == "10.0.0.5"
+
+    @pytest.mark.parametrize("scope", [{}, {"client": None}])
+    def test_client_host_missing(self, scope):
+        """Test a missing client is reported as unknown."""
+        assert client_host(scope) == "unknown"
+
+
 class TestAPIKeyAuth:
     """Tests for APIKeyAuth class."""
 
@@ -79,6 +93,12 @@ class TestAPIKeyValidation(TestAPIKeyAuth):
         assert auth_with_keys.validate_api_key("invalid") is False
         assert auth_with_keys.validate_api_key("key4") is False
 
+    def test_near_miss_and_non_ascii_keys_rejected(self, auth_with_keys: APIKeyAuth):
+        """Test that prefixes, padding and non-ASCII keys are rejected."""
+        assert auth_with_keys.validate_api_key("key") is False
+        assert auth_with_keys.validate_api_key("key1 ") is False
+        assert auth_with_keys.validate_api_key("kéy1") is False
+
     def test_empty_key_rejected(self, auth_with_keys: APIKeyAuth):
         """Test that empty keys are rejected."""
         assert auth_with_keys.validate_api_key("") is False
@@ -147,6 +167,17 @@ class TestPathExclusion(TestAPIKeyAuth):
         """Test that trailing slashes are handled."""
         assert auth_with_keys.is_path_excluded("/health/") is True
 
+    def test_partial_prefix_not_excluded(self, auth_with_keys: APIKeyAuth):
+        """Test that a path sharing only a name prefix is not excluded."""
+        assert auth_with_keys.is_path_excluded("/healthz") is False
+        assert auth_with_keys.is_path_excluded("/docs-admin") is False
+
+    def test_configured_trailing_slash_normalized(self):
+        """Test that excluded paths configured with a trailing slash still match."""
+        auth = APIKeyAuth(api_keys=["key"], excluded_paths={"/custom/"})
+        assert auth.is_path_excluded("/custom") is True
+        assert auth.is_path_excluded("/custom/sub") is True
+
 
 class TestAuthenticate(TestAPIKeyAuth):
     """Tests for the authenticate method."""
@@ -223,6 +254,14 @@ class TestAPIKeyProperties(TestAPIKeyAuth):
         assert "key1" in keys
         assert len(keys) == 3
 
+    def test_excluded_paths_property_is_immutable(self):
+        """Test excluded_paths is a frozen copy of the configured paths."""
+        configured = {"/custom"}
+        auth = APIKeyAuth(api_keys=["key"], excluded_paths=configured)
+        configured.add("/later")
+        assert auth.excluded_paths == frozenset({"/custom"})
+        assert isinstance(auth.excluded_paths, frozenset)
+
     def test_excluded_paths_property(self, auth_with_keys: APIKeyAuth):
         """Test excluded_paths property returns set."""
         paths = auth_with_keys.excluded_paths
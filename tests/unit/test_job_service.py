@@ -99,6 +99,14 @@ class TestJobModel:
         assert result["duration"] == 45.2
         assert result["created_at"] == "2024-01-15T10:30:00"
         assert result["completed_at"] == "2024-01-15T10:30:45"
+        assert result["started_at"] is None
+
+    def test_job_has_no_instance_dict(self) -> None:
+        """Test Job is slotted, so unknown attributes are rejected."""
+        job = Job(job_id="test-123", url="https://youtube.com/watch?v=abc")
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.unknown_field = "value"  # type: ignore[attr-defined]
 
 
 class TestJobServiceCreation:
@@ -4,9 +4,11 @@ import logging
 import re
 
 import pytest
+import structlog
 
 from app.core.logging import (
-    add_request_id,
+    _maybe_exc_info,
+    _maybe_stack_info,
     clear_request_id,
     configure_logging,
     get_logger,
@@ -85,32 +87,64 @@ class TestRequestIDManagement:
         assert get_request_id() is None
 
 
-class TestAddRequestIDProcessor:
-    """Test request_id processor for structlog"""
+class TestRequestIDContextBinding:
+    """Test request_id propagation through structlog contextvars"""
 
-    def test_add_request_id_when_set(self) -> None:
-        """Test request_id is added to event_dict when set"""
+    def test_request_id_merged_when_set(self) -> None:
+        """Test request_id is merged into event_dict when set"""
         set_request_id("test-request-456")
 
         event_dict = {"event": "test"}
-        result = add_request_id(None, "info", event_dict)
+        result = structlog.contextvars.merge_contextvars(None, "info", event_dict)
 
         assert result["request_id"] == "test-request-456"
         assert result["event"] == "test"
 
         clear_request_id()
 
-    def test_add_request_id_when_not_set(self) -> None:
-        """Test request_id is not added when not set"""
+    def test_request_id_not_merged_when_cleared(self) -> None:
+        """Test request_id is not merged after being cleared"""
+        set_request_id("test-request-789")
         clear_request_id()
 
         event_dict = {"event": "test"}
-        result = add_request_id(None, "info", event_dict)
+        result = structlog.contextvars.merge_contextvars(None, "info", event_dict)
 
         assert "request_id" not in result
         assert result["event"] == "test"
 
 
+class TestGatedExceptionProcessors:
+    """Test exc_info/stack_info processors are skipped when not requested"""
+
+    def test_maybe_exc_info_passthrough(self) -> None:
+        """Test event_dict without exc_info is returned untouched"""
+        event_dict = {"event": "test"}
+        assert _maybe_exc_info(None, "warning", event_dict) == {"event": "test"}
+
+    def test_maybe_exc_info_formats_exception(self) -> None:
+        """Test exc_info is rendered into an exception field"""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            result = _maybe_exc_info(None, "error", {"event": "test", "exc_info": e})
+
+        assert "exc_info" not in result
+        assert "ValueError: boom" in result["exception"]
+
+    def test_maybe_stack_info_passthrough(self) -> None:
+        """Test event_dict without stack_info is returned untouched"""
+        event_dict = {"event": "test"}
+        assert _maybe_stack_info(None, "info", event_dict) == {"event": "test"}
+
+    def test_maybe_stack_info_renders_stack(self) -> None:
+        """Test stack_info is rendered into a stack field"""
+        result = _maybe_stack_info(None, "info", {"event": "test", "stack_info": True})
+
+        assert "stack_info" not in result
+        assert "stack" in result
+
+
 class TestLoggingConfiguration:
     """Test logging configuration"""
 
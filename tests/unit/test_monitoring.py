@@ -34,6 +34,7 @@ from app.core.metrics import (
     http_request_duration_seconds,
     http_requests_total,
     initialize_metrics,
+    rate_limit_exceeded_total,
     storage_available_bytes,
     storage_percent_used,
     storage_used_bytes,
@@ -353,6 +354,19 @@ class TestMetricsCollection:
         histogram = http_request_duration_seconds.labels(method="POST", endpoint="/api/v1/download")
         assert histogram._sum.get() > 0
 
+    def test_record_request_separates_statuses(self) -> None:
+        """Test repeated requests update the series for their own status."""
+        ok = http_requests_total.labels(method="GET", endpoint="/repeat", status="200")
+        missing = http_requests_total.labels(method="GET", endpoint="/repeat", status="404")
+        ok_before, missing_before = ok._value.get(), missing._value.get()
+
+        for _ in range(3):
+            MetricsCollector.record_request("GET", "/repeat", 200, 0.01)
+        MetricsCollector.record_request("GET", "/repeat", 404, 0.01)
+
+        assert ok._value.get() == ok_before + 3
+        assert missing._value.get() == missing_before + 1
+
     def test_record_download_success(self) -> None:
         """Test download success metrics."""
         initial = downloads_total.labels(provider="youtube", status="success")._value.get()
@@ -417,6 +431,16 @@ class TestMetricsCollection:
 
         assert final == initial + 1
 
+    def test_record_rate_limit_exceeded(self) -> None:
+        """Test rate limit counter by category."""
+        initial = rate_limit_exceeded_total.labels(category="download")._value.get()
+
+        MetricsCollector.record_rate_limit_exceeded(category="download")
+
+        final = rate_limit_exceeded_total.labels(category="download")._value.get()
+
+        assert final == initial + 1
+
     def test_initialize_metrics(self) -> None:
         """Test metrics initialization with version."""
         initialize_metrics("1.0.0-test")
@@ -457,6 +481,55 @@ class TestMetricsEndpoint:
             assert "http_requests_total" in content or response.status_code == 200
 
 
+class TestMetricsMiddleware:
+    """Tests for the HTTP metrics middleware."""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        """Create a minimal app wrapped in the metrics middleware."""
+        from fastapi import FastAPI
+
+        from app.main import MetricsMiddleware
+
+        test_app = FastAPI()
+
+        @test_app.get("/items/{item_id}")
+        async def get_item(item_id: str) -> Dict[str, str]:
+            return {"id": item_id}
+
+        @test_app.get("/broken")
+        async def broken() -> None:
+            raise RuntimeError("boom")
+
+        test_app.add_middleware(MetricsMiddleware)
+        return TestClient(test_app, raise_server_exceptions=False)
+
+    @staticmethod
+    def _count(endpoint: str, status: str) -> float:
+        value: float = http_requests_total.labels(
+            method="GET", endpoint=endpoint, status=status
+        )._value.get()
+        return value
+
+    def test_records_route_template_and_status(self, client: TestClient) -> None:
+        """Test requests are labelled with the route template and status."""
+        before = self._count("/items/{item_id}", "200")
+        assert client.get("/items/abc").status_code == 200
+        assert self._count("/items/{item_id}", "200") == before + 1
+
+    def test_unmatched_route_uses_fixed_label(self, client: TestClient) -> None:
+        """Test unknown paths share one label."""
+        before = self._count("/unmatched", "404")
+        assert client.get("/no/such/path").status_code == 404
+        assert self._count("/unmatched", "404") == before + 1
+
+    def test_unhandled_error_recorded_as_500(self, client: TestClient) -> None:
+        """Test an exception before the response is still recorded."""
+        before = self._count("/broken", "500")
+        assert client.get("/broken").status_code == 500
+        assert self._count("/broken", "500") == before + 1
+
+
 class TestYouTubeConnectivityCheck:
     """Tests for YouTube connectivity health check."""
 
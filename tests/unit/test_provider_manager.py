@@ -3,7 +3,11 @@
 Covers requirement 34 (Provider Abstraction), historical task 2.4.
 """
 
+import functools
+import logging
+import re
 from typing import Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -135,6 +139,30 @@ class TestUrlSelection:
         with pytest.raises(InvalidURLError, match="No provider available"):
             manager.get_provider_for_url("https://youtube.com/watch?v=x")
 
+    def test_enabling_later_makes_provider_selectable(self, manager):
+        """Enabling after registration adds the provider to selection in order."""
+        first = FakeProvider("example.com")
+        second = FakeProvider("example.com")
+        manager.register_provider("first", first, enabled=False)
+        manager.register_provider("second", second)
+        assert manager.get_provider_for_url("https://example.com/v") is second
+
+        manager.enable_provider("first")
+
+        assert manager.get_provider_for_url("https://example.com/v") is first
+
+    def test_disabled_provider_is_not_consulted(self, manager):
+        """Selection never calls validate_url on a disabled provider."""
+        disabled = FakeProvider(raise_on_validate=True)
+        manager.register_provider("disabled", disabled, enabled=False)
+        youtube = FakeProvider("youtube.com")
+        manager.register_provider("youtube", youtube)
+
+        with patch.object(disabled, "validate_url") as validate:
+            assert manager.get_provider_for_url("https://youtube.com/watch?v=x") is youtube
+
+        validate.assert_not_called()
+
     def test_no_match_raises_invalid_url(self, manager):
         """URL matched by no provider raises InvalidURLError."""
         manager.register_provider("youtube", FakeProvider("youtube.com"))
@@ -160,6 +188,105 @@ class TestUrlSelection:
             manager.get_provider_for_url("https://youtube.com/watch?v=x")
 
 
+class PatternProvider(FakeProvider):
+    """Provider that declares compiled URL patterns and keeps the default validate_url."""
+
+    url_patterns = (re.compile(r"https://vimeo\.com/\d+"),)
+    validate_url = VideoProvider.validate_url
+
+
+class NarrowedPatternProvider(PatternProvider):
+    """Provider whose validate_url rejects some URLs its patterns match."""
+
+    def validate_url(self, url: str) -> bool:
+        """Reject the reserved video ID."""
+        return super().validate_url(url) and not url.endswith("/0")
+
+
+class TestDeclaredUrlPatterns:
+    """Selection through providers' compiled url_patterns."""
+
+    def test_patterns_used_instead_of_validate_url(self, manager):
+        """Declared patterns are matched without calling validate_url."""
+        vimeo = PatternProvider()
+        manager.register_provider("vimeo", vimeo)
+        vimeo.validate_url = lambda url: pytest.fail("validate_url should not be called")
+
+        assert manager.get_provider_for_url("https://vimeo.com/12345") is vimeo
+
+    def test_pattern_miss_falls_through(self, manager):
+        """A URL no pattern matches moves on to the next provider."""
+        manager.register_provider("vimeo", PatternProvider())
+        youtube = FakeProvider("youtube.com")
+        manager.register_provider("youtube", youtube)
+
+        assert manager.get_provider_for_url("https://youtube.com/watch?v=x") is youtube
+
+    def test_default_validate_url_uses_patterns(self):
+        """Providers declaring only url_patterns inherit a matching validate_url."""
+        provider = PatternProvider()
+
+        assert provider.validate_url("https://vimeo.com/12345") is True
+        assert provider.validate_url("https://vimeo.com/about") is False
+
+    def test_overridden_validate_url_is_called(self, manager):
+        """A subclass narrowing validate_url is honoured despite matching patterns."""
+        vimeo = NarrowedPatternProvider()
+        manager.register_provider("vimeo", vimeo)
+
+        assert manager.get_provider_for_url("https://vimeo.com/12345") is vimeo
+        with pytest.raises(InvalidURLError):
+            manager.get_provider_for_url("https://vimeo.com/0")
+
+    def test_reregistering_without_patterns_uses_validate_url(self, manager):
+        """Replacing a provider drops the patterns of the old one."""
+        manager.register_provider("vimeo", PatternProvider())
+        plain = FakeProvider("vimeo.com")
+        manager.register_provider("vimeo", plain)
+
+        assert manager.get_provider_for_url("https://vimeo.com/12345") is plain
+
+
+class TestSelectionLogging:
+    """Debug events for provider selection are gated on the log level."""
+
+    @pytest.mark.parametrize("level,expected_calls", [(logging.INFO, 0), (logging.DEBUG, 2)])
+    def test_debug_event_gated(self, manager, caplog, level, expected_calls):
+        """Selection debug events are only built when DEBUG is enabled."""
+        caplog.set_level(level, logger="app.providers.manager")
+        manager.register_provider("youtube", FakeProvider("youtube.com"))
+
+        with patch("app.providers.manager.logger") as mock_logger:
+            manager.get_provider_for_url("https://youtube.com/watch?v=x")
+            manager.get_provider_for_url("https://youtube.com/watch?v=x")
+
+        assert mock_logger.debug.call_count == expected_calls
+
+
+class TestRegistryChanges:
+    """Selection follows registry changes after earlier selections."""
+
+    def test_disable_stops_selection(self, manager):
+        """Disabling a provider stops URLs it selected before from selecting it."""
+        manager.register_provider("youtube", FakeProvider("youtube.com"))
+        manager.get_provider_for_url("https://youtube.com/watch?v=x")
+
+        manager.disable_provider("youtube")
+
+        with pytest.raises(InvalidURLError):
+            manager.get_provider_for_url("https://youtube.com/watch?v=x")
+
+    def test_reregister_replaces_selection(self, manager):
+        """Registering a provider under an existing name replaces it in selection."""
+        manager.register_provider("youtube", FakeProvider("youtube.com"))
+        manager.get_provider_for_url("https://youtube.com/watch?v=x")
+
+        replacement = FakeProvider("youtube.com")
+        manager.register_provider("youtube", replacement)
+
+        assert manager.get_provider_for_url("https://youtube.com/watch?v=x") is replacement
+
+
 class TestErrorIsolation:
     """Wrapping semantics of execute_with_error_isolation."""
 
@@ -195,3 +322,17 @@ class TestErrorIsolation:
             await manager.execute_with_error_isolation("youtube", operation)
 
         assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_callable_without_name(self, manager, caplog):
+        """Callables lacking __name__ (e.g. partials) are logged by repr."""
+        caplog.set_level(logging.DEBUG, logger="app.providers.manager")
+
+        async def operation(value):
+            return value * 2
+
+        result = await manager.execute_with_error_isolation(
+            "youtube", functools.partial(operation, 21)
+        )
+
+        assert result == 42
@@ -12,12 +12,13 @@ Satisfies Requirement 27: Rate Limiting.
 
 import asyncio
 import time
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.core.metrics import rate_limit_exceeded_total
 from app.core.rate_limiter import (
     RateLimitConfig,
     RateLimiter,
@@ -38,7 +39,7 @@ class TestTokenBucket:
         assert bucket.capacity == 20
         assert bucket.refill_rate == 1.67
         assert bucket.tokens == 20.0  # Should start at capacity
-        assert bucket.last_refill > 0
+        assert bucket.last_refill_ns > 0
 
     def test_token_bucket_custom_tokens(self):
         """Test TokenBucket with explicit token count."""
@@ -49,13 +50,24 @@ class TestTokenBucket:
 
     def test_token_bucket_defaults(self):
         """Test TokenBucket default values."""
-        before = time.time()
+        before = time.monotonic_ns()
         bucket = TokenBucket(capacity=10, refill_rate=0.5)
-        after = time.time()
+        after = time.monotonic_ns()
 
         assert bucket.capacity == 10
         assert bucket.tokens == 10.0
-        assert before <= bucket.last_refill <= after
+        assert before <= bucket.last_refill_ns <= after
+
+    def test_token_bucket_seconds_per_token(self):
+        """Test seconds_per_token is the inverse of refill_rate."""
+        assert TokenBucket(capacity=10, refill_rate=0.5).seconds_per_token == 2.0
+        assert TokenBucket(capacity=10, refill_rate=0.0).seconds_per_token == 3600.0
+
+    def test_token_bucket_uses_slots(self):
+        """Test TokenBucket has no per-instance __dict__."""
+        bucket = TokenBucket(capacity=10, refill_rate=0.5)
+
+        assert not hasattr(bucket, "__dict__")
 
 
 class TestRateLimitConfig:
@@ -68,6 +80,12 @@ class TestRateLimitConfig:
         assert config.rpm == 100
         assert config.burst_capacity == 20
 
+    def test_rate_limit_config_refill_rate(self):
+        """Test refill_rate is derived from rpm."""
+        config = RateLimitConfig(rpm=120)
+
+        assert config.refill_rate == 2.0
+
     def test_rate_limit_config_custom(self):
         """Test RateLimitConfig with custom values."""
         config = RateLimitConfig(rpm=50, burst_capacity=10)
@@ -184,6 +202,34 @@ class TestEndpointCategory:
         # Prefix matching
         assert limiter.get_endpoint_category("/api/v1/info?url=test") == "metadata"
 
+    def test_configured_endpoint_with_trailing_slash(self):
+        """Test endpoints configured with a trailing slash are normalized."""
+        limiter = RateLimiter(endpoint_categories={"/api/v2/info/": "metadata"})
+
+        assert limiter.get_endpoint_category("/api/v2/info") == "metadata"
+        assert limiter.get_endpoint_category("/api/v2/info/details") == "metadata"
+
+    def test_subpath_match(self):
+        """Test subpaths map to their parent endpoint category."""
+        limiter = RateLimiter()
+
+        assert limiter.get_endpoint_category("/api/v1/download/details") == "download"
+
+    def test_longest_prefix_wins(self):
+        """Test the most specific endpoint prefix is preferred."""
+        limiter = RateLimiter(
+            endpoint_categories={"/api": "metadata", "/api/v1/download": "download"}
+        )
+
+        assert limiter.get_endpoint_category("/api/v1/download/x") == "download"
+        assert limiter.get_endpoint_category("/api/v1/info") == "metadata"
+
+    def test_partial_segment_not_matched(self):
+        """Test prefixes only match on a path or query boundary."""
+        limiter = RateLimiter()
+
+        assert limiter.get_endpoint_category("/api/v1/information") is None
+
     def test_unknown_path(self):
         """Test unknown paths return None."""
         limiter = RateLimiter()
@@ -326,6 +372,30 @@ class TestRateLimitEnforcement:
         # 10 rpm = 0.167 tokens/sec vs 100 rpm = 1.67 tokens/sec
         assert retry_after > 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_do_not_over_admit(self):
+        """Test concurrent coroutines cannot consume more than the burst capacity."""
+        limiter = RateLimiter()
+
+        results = await asyncio.gather(
+            *(limiter.check_rate_limit("test-key", "download") for _ in range(50))
+        )
+
+        assert sum(allowed for allowed, _ in results) == 20
+
+    @pytest.mark.asyncio
+    async def test_rejection_counted_in_metrics(self):
+        """Test rejected requests increment the rate limit counter."""
+        limiter = RateLimiter()
+        counter = rate_limit_exceeded_total.labels(category="download")
+        for _ in range(20):
+            await limiter.check_rate_limit("test-key", "download")
+        initial = counter._value.get()
+
+        await limiter.check_rate_limit("test-key", "download")
+
+        assert counter._value.get() == initial + 1
+
 
 class TestRetryAfterCalculation:
     """Tests for Retry-After header calculation."""
@@ -440,6 +510,28 @@ class TestBucketReset:
         assert metadata_status["tokens"] == 20
         assert download_status["tokens"] == 20
 
+    def test_reset_all_leaves_other_keys(self):
+        """Test resetting one API key does not touch other keys."""
+        limiter = RateLimiter()
+        limiter._get_bucket("key1", "metadata")
+        limiter._get_bucket("key1", "download")
+        other = limiter._get_bucket("key2", "metadata")
+
+        limiter.reset_bucket("key1")
+
+        assert list(limiter._buckets.values()) == [other]
+        assert limiter._categories_by_key == {"key2": {"metadata"}}
+
+    def test_eviction_updates_key_index(self):
+        """Test evicted buckets are dropped from the per-key index."""
+        limiter = RateLimiter(max_api_keys=1)
+        limiter._get_bucket("key1", "metadata")
+        limiter._get_bucket("key2", "metadata")
+        limiter._get_bucket("key3", "metadata")
+
+        assert "key1" not in limiter._categories_by_key
+        limiter.reset_bucket("key1")  # no-op for an evicted key
+
     def test_clear_all_buckets(self):
         """Test clearing all buckets."""
         limiter = RateLimiter()
@@ -455,6 +547,63 @@ class TestBucketReset:
         assert len(limiter._buckets) == 0
 
 
+class TestBucketEviction:
+    """Tests for LRU bucket eviction (DoS protection)."""
+
+    def test_tracked_keys_are_bounded(self):
+        """Test at most max_api_keys distinct API keys are tracked."""
+        limiter = RateLimiter(max_api_keys=3)
+
+        for i in range(100):
+            limiter._get_bucket(f"key-{i}", "metadata")
+
+        assert len(limiter._categories_by_key) == 3
+        assert len(limiter._buckets) == 3
+
+    def test_new_category_for_tracked_key_does_not_evict(self):
+        """Test a tracked key can add buckets for other categories at the limit."""
+        limiter = RateLimiter(max_api_keys=1)
+        limiter._get_bucket("key-a", "metadata")
+        limiter._get_bucket("key-a", "download")
+
+        assert limiter._categories_by_key == {"key-a": {"metadata", "download"}}
+
+    def test_new_key_evicts_all_buckets_of_lru_key(self):
+        """Test a multi-category key is fully dropped to make room for a new key."""
+        limiter = RateLimiter(max_api_keys=1)
+        limiter._get_bucket("key-a", "metadata")
+        limiter._get_bucket("key-a", "download")
+
+        limiter._get_bucket("key-b", "metadata")
+
+        assert list(limiter._buckets) == [("key-b", "metadata")]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_bucket_evicted(self):
+        """Test the least recently used bucket is evicted first."""
+        limiter = RateLimiter(max_api_keys=2)
+        await limiter.check_rate_limit("old-key", "metadata")
+        await limiter.check_rate_limit("hot-key", "metadata")
+
+        # Touch hot-key so old-key becomes least recently used
+        await limiter.check_rate_limit("hot-key", "metadata")
+        await limiter.check_rate_limit("new-key", "metadata")
+
+        assert ("old-key", "metadata") not in limiter._buckets
+        assert limiter.get_bucket_status("hot-key", "metadata")["tokens"] < 19
+
+    def test_evicted_key_gets_fresh_bucket(self):
+        """Test an evicted key is recreated with a full bucket."""
+        limiter = RateLimiter(max_api_keys=1)
+        bucket = limiter._get_bucket("key-a", "metadata")
+        bucket.tokens = 0.0
+
+        limiter._get_bucket("key-b", "metadata")
+        limiter._get_bucket("key-c", "metadata")
+
+        assert limiter._get_bucket("key-a", "metadata").tokens == 20.0
+
+
 class TestGlobalRateLimiter:
     """Tests for global rate limiter functions."""
 
@@ -472,6 +621,35 @@ class TestGlobalRateLimiter:
         assert limiter.limits["metadata"].rpm == 200
         assert limiter.limits["download"].rpm == 20
 
+    def test_configure_rate_limiter_burst_only(self):
+        """Test configuring only burst capacity keeps the configured rpm."""
+        limiter = get_rate_limiter()
+        original_limits = limiter.limits.copy()
+        try:
+            configure_rate_limiter(burst_capacity=5)
+
+            assert limiter.limits["metadata"].burst_capacity == 5
+            assert limiter.limits["download"].burst_capacity == 5
+            assert limiter.limits["metadata"].rpm == original_limits["metadata"].rpm
+        finally:
+            limiter.limits = original_limits
+
+    @pytest.mark.asyncio
+    async def test_configure_rate_limiter_resets_buckets(self):
+        """Test reconfiguring drops buckets built with the old limits."""
+        limiter = get_rate_limiter()
+        original_limits = limiter.limits.copy()
+        try:
+            await limiter.check_rate_limit("global-key", "metadata")
+
+            configured = configure_rate_limiter(burst_capacity=5)
+
+            assert configured is limiter
+            assert limiter.get_bucket_status("global-key", "metadata")["capacity"] == 5
+        finally:
+            limiter.limits = original_limits
+            limiter.clear_all_buckets()
+
 
 class TestRateLimitMiddleware:
     """Tests for RateLimitMiddleware."""
@@ -577,6 +755,56 @@ class TestRateLimitMiddleware:
         response_download = client.post("/api/v1/download", headers={"X-API-Key": "test-key"})
         assert response_download.status_code == 200
 
+    def test_middleware_limits_per_api_key(self, app, limiter):
+        """Test each X-API-Key header gets its own bucket."""
+        app.add_middleware(RateLimitMiddleware, rate_limiter=limiter)
+        client = TestClient(app)
+
+        for _ in range(20):
+            client.get("/api/v1/info", headers={"X-API-Key": "key-a"})
+
+        assert client.get("/api/v1/info", headers={"X-API-Key": "key-a"}).status_code == 429
+        assert client.get("/api/v1/info", headers={"X-API-Key": "key-b"}).status_code == 200
+        assert client.get("/api/v1/info").status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_middleware_passes_non_http_scopes(self, limiter):
+        """Test lifespan and websocket scopes bypass rate limiting."""
+        inner = AsyncMock()
+        middleware = RateLimitMiddleware(inner, rate_limiter=limiter)
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        inner.assert_awaited_once_with(scope, receive, send)
+        send.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after", [0.25, 5.0, 12.345678])
+    async def test_rejection_matches_json_response(self, limiter, retry_after):
+        """Test the pre-encoded 429 renders the same bytes as JSONResponse."""
+        from fastapi.responses import JSONResponse
+
+        middleware = RateLimitMiddleware(AsyncMock(), rate_limiter=limiter)
+        send = AsyncMock()
+
+        await middleware._send_rate_limited(send, "metadata", retry_after)
+
+        expected = JSONResponse(
+            status_code=429,
+            headers={"Retry-After": str(int(retry_after) + 1)},
+            content={
+                "error_code": "RATE_LIMIT_EXCEEDED",
+                "message": "Rate limit exceeded for metadata operations",
+                "retry_after": retry_after,
+            },
+        )
+        start, body = (c.args[0] for c in send.await_args_list)
+        assert start["status"] == 429
+        assert sorted(start["headers"]) == sorted(expected.raw_headers)
+        assert body["body"] == expected.body
+
 
 class TestCreateRateLimitMiddleware:
     """Tests for create_rate_limit_middleware factory."""
@@ -603,6 +831,40 @@ class TestCreateRateLimitMiddleware:
         assert middleware.excluded_paths == excluded
 
 
+class TestRateLimitMiddlewareOptions:
+    """Tests for RateLimitMiddleware constructor options."""
+
+    def test_uses_given_rate_limiter(self):
+        """Test the middleware uses the limiter it is given."""
+        limiter = RateLimiter()
+        middleware = RateLimitMiddleware(MagicMock(), rate_limiter=limiter)
+
+        assert middleware.rate_limiter is limiter
+
+    def test_custom_excluded_paths(self):
+        """Test custom excluded paths replace the defaults."""
+        excluded = frozenset({"/custom"})
+        middleware = RateLimitMiddleware(MagicMock(), excluded_paths=excluded)
+
+        assert middleware.excluded_paths == excluded
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/docs", True),
+            ("/docs/", True),
+            ("/docs/oauth2-redirect", True),
+            ("/docs-admin", False),
+            ("/healthz", False),
+            ("/api/v1/info", False),
+        ],
+    )
+    def test_excluded_path_matching(self, path, expected):
+        """Test exact and subpath matching without partial-name matches."""
+        middleware = RateLimitMiddleware(MagicMock(), rate_limiter=RateLimiter())
+        assert middleware._is_excluded_path(path) is expected
+
+
 class TestRateLimitMiddlewareExcludedPaths:
     """Tests for middleware excluded paths."""
 
@@ -650,3 +912,19 @@ class TestRateLimitMiddlewareExcludedPaths:
             response = client.get("/api/v1/info")
             # Note: May return 404 if endpoint doesn't exist, but won't return 429
             assert response.status_code != 429 or response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_excluded_categorized_path_skips_limiter(self):
+        """Test an excluded path is not checked even if it has a category."""
+        limiter = RateLimiter()
+        limiter.check_rate_limit = AsyncMock(return_value=(False, 1.0))
+        inner = AsyncMock()
+        middleware = RateLimitMiddleware(
+            inner, rate_limiter=limiter, excluded_paths=frozenset({"/api/v1/info"})
+        )
+        scope = {"type": "http", "path": "/api/v1/info", "headers": []}
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        inner.assert_awaited_once()
+        limiter.check_rate_limit.assert_not_called()
@@ -1,7 +1,11 @@
 """Unit tests for resource monitoring and validation."""
 
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from app.core import resources
 from app.core.resources import (
     ResourceCheckResult,
     ResourceRequirements,
@@ -11,6 +15,18 @@ from app.core.resources import (
 )
 
 
+def _statvfs(total_gb: int, free_gb: int) -> MagicMock:
+    """Build an os.statvfs result with no reserved blocks."""
+    block_size = 4096
+    free_blocks = free_gb * 1024**3 // block_size
+    return MagicMock(
+        f_frsize=block_size,
+        f_blocks=total_gb * 1024**3 // block_size,
+        f_bfree=free_blocks,
+        f_bavail=free_blocks,
+    )
+
+
 class TestResourceUsage:
     """Tests for ResourceUsage dataclass."""
 
@@ -65,9 +81,39 @@ class TestResourceRequirements:
 class TestGetCurrentUsage:
     """Tests for get_current_usage function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_usage_cache(self) -> Iterator[None]:
+        """Isolate tests from cached readings."""
+        resources._usage_cache.clear()
+        yield
+        resources._usage_cache.clear()
+
+    @patch("app.core.resources.psutil.cpu_percent", return_value=5.0)
+    @patch("app.core.resources.psutil.virtual_memory")
+    @patch("app.core.resources.os.statvfs")
+    def test_first_read_samples_cpu(
+        self,
+        mock_disk: MagicMock,
+        mock_memory: MagicMock,
+        mock_cpu: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the first read samples CPU briefly and later reads don't block."""
+        monkeypatch.setattr(resources, "_cpu_primed", False)
+        mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
+        mock_disk.return_value = _statvfs(total_gb=100, free_gb=50)
+
+        get_current_usage(max_age=0)
+        get_current_usage(max_age=0)
+
+        assert [c.kwargs for c in mock_cpu.call_args_list] == [
+            {"interval": 0.1},
+            {"interval": None},
+        ]
+
     @patch("app.core.resources.psutil.cpu_percent")
     @patch("app.core.resources.psutil.virtual_memory")
-    @patch("app.core.resources.psutil.disk_usage")
+    @patch("app.core.resources.os.statvfs")
     def test_get_current_usage_success(
         self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
     ) -> None:
@@ -80,11 +126,7 @@ class TestGetCurrentUsage:
             percent=50.0,
         )
 
-        mock_disk.return_value = MagicMock(
-            total=500 * 1024**3,  # 500 GB
-            free=250 * 1024**3,  # 250 GB
-            percent=50.0,
-        )
+        mock_disk.return_value = _statvfs(total_gb=500, free_gb=250)
 
         usage = get_current_usage("/tmp")
 
@@ -98,14 +140,14 @@ class TestGetCurrentUsage:
 
     @patch("app.core.resources.psutil.cpu_percent")
     @patch("app.core.resources.psutil.virtual_memory")
-    @patch("app.core.resources.psutil.disk_usage")
+    @patch("app.core.resources.os.statvfs")
     def test_get_current_usage_default_path(
         self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
     ) -> None:
         """Test getting usage with default path."""
         mock_cpu.return_value = 10.0
         mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
-        mock_disk.return_value = MagicMock(total=100 * 1024**3, free=50 * 1024**3, percent=50.0)
+        mock_disk.return_value = _statvfs(total_gb=100, free_gb=50)
 
         usage = get_current_usage()
 
@@ -113,6 +155,72 @@ class TestGetCurrentUsage:
         mock_disk.assert_called_once_with("/")
         assert usage is not None
 
+    @patch("app.core.resources.psutil.cpu_percent")
+    @patch("app.core.resources.psutil.virtual_memory")
+    @patch("app.core.resources.os.statvfs")
+    def test_get_current_usage_missing_path_falls_back_to_root(
+        self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
+    ) -> None:
+        """Test a missing disk path falls back to the root filesystem."""
+        mock_cpu.return_value = 10.0
+        mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
+        mock_disk.side_effect = [FileNotFoundError(), _statvfs(total_gb=100, free_gb=25)]
+
+        usage = get_current_usage("/does/not/exist")
+
+        assert mock_disk.call_args_list[-1].args == ("/",)
+        assert usage.disk_available_gb == 25.0
+        assert usage.disk_percent == 75.0
+
+    @patch("app.core.resources.psutil.cpu_percent")
+    @patch("app.core.resources.psutil.virtual_memory")
+    @patch("app.core.resources.os.statvfs")
+    def test_get_current_usage_non_blocking_cpu(
+        self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
+    ) -> None:
+        """Test CPU usage is sampled without a blocking interval."""
+        mock_cpu.return_value = 10.0
+        mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
+        mock_disk.return_value = _statvfs(total_gb=100, free_gb=50)
+
+        get_current_usage()
+
+        mock_cpu.assert_called_once_with(interval=None)
+
+    @patch("app.core.resources.psutil.cpu_percent")
+    @patch("app.core.resources.psutil.virtual_memory")
+    @patch("app.core.resources.os.statvfs")
+    def test_get_current_usage_cached(
+        self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
+    ) -> None:
+        """Test repeated reads within the TTL are served from cache per path."""
+        mock_cpu.return_value = 10.0
+        mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
+        mock_disk.return_value = _statvfs(total_gb=100, free_gb=50)
+
+        first = get_current_usage()
+        second = get_current_usage()
+        get_current_usage("/tmp")
+
+        assert second is first
+        assert mock_memory.call_count == 2  # one read for "/" and one for "/tmp"
+
+    @patch("app.core.resources.psutil.cpu_percent")
+    @patch("app.core.resources.psutil.virtual_memory")
+    @patch("app.core.resources.os.statvfs")
+    def test_get_current_usage_max_age_zero_bypasses_cache(
+        self, mock_disk: MagicMock, mock_memory: MagicMock, mock_cpu: MagicMock
+    ) -> None:
+        """Test max_age=0 always reads fresh values."""
+        mock_cpu.return_value = 10.0
+        mock_memory.return_value = MagicMock(total=8 * 1024**3, available=4 * 1024**3, percent=50.0)
+        mock_disk.return_value = _statvfs(total_gb=100, free_gb=50)
+
+        get_current_usage()
+        get_current_usage(max_age=0)
+
+        assert mock_memory.call_count == 2
+
 
 class TestCheckMinimumResources:
     """Tests for check_minimum_resources function."""
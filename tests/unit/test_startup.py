@@ -8,12 +8,21 @@ This module tests the startup validation system including:
 - yt-dlp runtime configuration
 """
 
+import asyncio
+import threading
 from pathlib import Path
+from typing import Iterator, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.core.checks import CheckResult, check_ffmpeg, check_nodejs, check_ytdlp
+from app.core.checks import (
+    SPAWN_CONCURRENCY,
+    CheckResult,
+    check_ffmpeg,
+    check_nodejs,
+    check_ytdlp,
+)
 from app.core.config import (
     Config,
     ProvidersConfig,
@@ -21,13 +30,26 @@ from app.core.config import (
     StorageConfig,
     YouTubeProviderConfig,
 )
-from app.core.startup import ComponentCheckResult, StartupResult, StartupValidator
+from app.core.startup import (
+    ComponentCheckResult,
+    StartupResult,
+    StartupValidator,
+    clear_startup_cache,
+)
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_startup_cache() -> Iterator[None]:
+    """Isolate tests from cached binary check results."""
+    clear_startup_cache()
+    yield
+    clear_startup_cache()
+
+
 @pytest.fixture
 def tmp_output_dir(tmp_path: Path) -> Path:
     """Create a temporary output directory."""
@@ -161,6 +183,33 @@ class TestCheckYtdlp:
             assert "non-zero" in result.error.lower()
 
 
+class TestSpawnConcurrency:
+    """Tests for the subprocess spawn limit shared by binary checks."""
+
+    @pytest.mark.asyncio
+    async def test_spawns_are_bounded(self) -> None:
+        """Test at most SPAWN_CONCURRENCY checks spawn at once, and all complete."""
+        active = 0
+        peak = 0
+
+        async def fake_spawn(*args: object, **kwargs: object) -> AsyncMock:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            proc = AsyncMock()
+            proc.returncode = 0
+            proc.communicate = AsyncMock(return_value=(b"2024.01.15", b""))
+            return proc
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_spawn):
+            results = await asyncio.gather(*(check_ytdlp() for _ in range(5)))
+
+        assert peak == SPAWN_CONCURRENCY
+        assert all(r.available for r in results)
+
+
 class TestCheckFfmpeg:
     """Tests for check_ffmpeg function."""
 
@@ -344,6 +393,51 @@ class TestStartupValidatorChecks:
             assert result.critical is True
             assert "20" in result.message
 
+    @pytest.mark.asyncio
+    async def test_passing_binary_check_cached_across_validators(self, config: Config) -> None:
+        """Test a passing binary check is reused by later validator instances."""
+        mock_check = AsyncMock(return_value=CheckResult("ytdlp", True, "2024.01.15"))
+        with patch("app.core.startup.check_ytdlp", mock_check):
+            first = await StartupValidator(config).check_ytdlp()
+            second = await StartupValidator(config).check_ytdlp()
+
+        assert mock_check.await_count == 1
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_failing_binary_check_not_cached(self, validator: StartupValidator) -> None:
+        """Test failed binary checks are re-probed on the next run."""
+        mock_check = AsyncMock(return_value=CheckResult("ffmpeg", False, error="not found"))
+        with patch("app.core.startup.check_ffmpeg", mock_check):
+            await validator.check_ffmpeg()
+            await validator.check_ffmpeg()
+
+        assert mock_check.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_binary_checks_share_probe(self, validator: StartupValidator) -> None:
+        """Test concurrent validations wait for a single probe."""
+        mock_check = AsyncMock(return_value=CheckResult("nodejs", True, "v20.10.0"))
+        with patch("app.core.startup.check_nodejs", mock_check):
+            await asyncio.gather(validator.check_nodejs(), validator.check_nodejs())
+
+        assert mock_check.await_count == 1
+
+    def test_binary_check_locks_work_across_event_loops(self, validator: StartupValidator) -> None:
+        """Test contended probes on a later event loop do not reuse a bound lock."""
+
+        async def failing_probe() -> CheckResult:
+            await asyncio.sleep(0)
+            return CheckResult("ffmpeg", False, error="not found")
+
+        async def contend() -> None:
+            await asyncio.gather(validator.check_ffmpeg(), validator.check_ffmpeg())
+
+        with patch("app.core.startup.check_ffmpeg", side_effect=failing_probe):
+            asyncio.run(contend())
+            asyncio.run(contend())
+
 
 class TestStorageValidation:
     """Tests for storage directory validation."""
@@ -376,6 +470,22 @@ class TestStorageValidation:
         assert result.passed is True
         assert output_dir.exists()
 
+    @pytest.mark.asyncio
+    async def test_storage_path_is_a_file(self, tmp_path: Path) -> None:
+        """Test storage check fails when the output path is an existing file."""
+        output_file = tmp_path / "downloads"
+        output_file.write_text("")
+        output_file.chmod(0o755)
+
+        config = Config(
+            security=SecurityConfig(api_keys=["test"]),
+            storage=StorageConfig(output_dir=str(output_file)),
+        )
+        result = await StartupValidator(config).check_storage()
+
+        assert result.passed is False
+        assert result.critical is True
+
     @pytest.mark.asyncio
     async def test_storage_permission_error(self, tmp_path: Path) -> None:
         """Test storage check fails when directory is not writable."""
@@ -388,13 +498,60 @@ class TestStorageValidation:
         )
         validator = StartupValidator(config)
 
-        with patch.object(Path, "touch", side_effect=PermissionError()):
+        with (
+            patch("app.core.startup.os.access", return_value=False),
+            patch.object(Path, "touch", side_effect=PermissionError()),
+        ):
             result = await validator.check_storage()
 
             assert result.passed is False
             assert result.critical is True
             assert "cannot write" in result.message.lower()
 
+    @pytest.mark.asyncio
+    async def test_storage_check_does_not_block_event_loop(
+        self, validator: StartupValidator
+    ) -> None:
+        """Test the blocking filesystem work runs off the event loop thread."""
+        loop_thread = threading.get_ident()
+        seen: List[int] = []
+
+        def record_thread() -> ComponentCheckResult:
+            seen.append(threading.get_ident())
+            return ComponentCheckResult(name="storage", passed=True, critical=True, message="ok")
+
+        with patch.object(validator, "_check_storage_sync", side_effect=record_thread):
+            result = await validator.check_storage()
+
+        assert result.passed is True
+        assert seen and seen[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_storage_access_fast_path_skips_probe_file(
+        self, validator: StartupValidator, tmp_output_dir: Path
+    ) -> None:
+        """Test a writable directory is confirmed without creating a probe file."""
+        with patch.object(Path, "touch") as mock_touch:
+            result = await validator.check_storage()
+
+        assert result.passed is True
+        assert result.details is not None
+        assert result.details["probe"] == "access"
+        mock_touch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_storage_access_false_negative_falls_back_to_touch(
+        self, validator: StartupValidator, tmp_output_dir: Path
+    ) -> None:
+        """Test a negative os.access answer is confirmed with a probe file."""
+        with patch("app.core.startup.os.access", return_value=False):
+            result = await validator.check_storage()
+
+        assert result.passed is True
+        assert result.details is not None
+        assert result.details["probe"] == "touch"
+        assert list(tmp_output_dir.glob(".write_test_*")) == []
+
 
 class TestCookieValidation:
     """Tests for cookie file validation."""
@@ -409,6 +566,72 @@ class TestCookieValidation:
         assert result.passed is True
         assert result.critical is False
 
+    @pytest.mark.asyncio
+    async def test_cookie_entries_counted(self, tmp_path: Path) -> None:
+        """Test valid entries are counted, skipping comments, blanks and bad lines."""
+        cookie_file = tmp_path / "cookies.txt"
+        cookie_file.write_text(
+            "# Netscape HTTP Cookie File\r\n"
+            "\r\n"
+            ".youtube.com\tTRUE\t/\tTRUE\t1234567890\tname\tvalue\r\n"
+            ".youtube.com\tTRUE\t/\tTRUE\t1234567890\tempty\t\r\n"
+            "\t\t\t\t\t\t\n"
+            "\t\t\t\t\t\t\r\n"
+            "not a cookie line\n"
+        )
+        config = Config(
+            security=SecurityConfig(api_keys=["test"], allow_degraded_start=False),
+            storage=StorageConfig(output_dir=str(tmp_path)),
+            providers=ProvidersConfig(
+                youtube=YouTubeProviderConfig(enabled=True, cookie_path=str(cookie_file))
+            ),
+        )
+
+        result = await StartupValidator(config, detailed_cookies=True).check_cookies()
+
+        assert result.passed is True
+        assert result.details is not None
+        assert result.details["valid_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cookie_check_stops_at_first_entry_by_default(
+        self, validator: StartupValidator, tmp_cookie_file: Path
+    ) -> None:
+        """Test the default check only needs one valid entry and omits the count."""
+        with patch.object(StartupValidator, "_count_cookie_entries", return_value=1) as mock_count:
+            result = await validator.check_cookies()
+
+        assert result.passed is True
+        assert "valid_entries" not in result.details
+        assert mock_count.call_args.kwargs == {"stop_at_first": True}
+
+    def test_count_cookie_entries_stop_at_first(self, tmp_path: Path) -> None:
+        """Test stop_at_first caps the count at one valid entry."""
+        cookie_file = tmp_path / "cookies.txt"
+        cookie_file.write_bytes(b".a\tTRUE\t/\tTRUE\t0\tn\tv\n" * 3)
+
+        assert StartupValidator._count_cookie_entries(cookie_file, stop_at_first=True) == 1
+        assert StartupValidator._count_cookie_entries(cookie_file) == 3
+
+    def test_count_cookie_entries_field_boundaries(self, tmp_path: Path) -> None:
+        """Test only lines with exactly 7 fields count, including an unterminated last line."""
+        cookie_file = tmp_path / "cookies.txt"
+        cookie_file.write_bytes(
+            b"#HttpOnly_.youtube.com\tTRUE\t/\tTRUE\t0\tcommented\tvalue\n"
+            b".youtube.com\tTRUE\t/\tTRUE\t0\tsix\n"
+            b".youtube.com\tTRUE\t/\tTRUE\t0\teight\tvalue\textra\n"
+            b".youtube.com\tTRUE\t/\tTRUE\t0\tlast\tvalue"
+        )
+
+        assert StartupValidator._count_cookie_entries(cookie_file) == 1
+
+    def test_count_cookie_entries_whitespace_only(self, tmp_path: Path) -> None:
+        """Test a whitespace-only file is reported as having no content."""
+        cookie_file = tmp_path / "cookies.txt"
+        cookie_file.write_bytes(b"\n  \r\n\t\n")
+
+        assert StartupValidator._count_cookie_entries(cookie_file) is None
+
     @pytest.mark.asyncio
     async def test_cookie_file_not_found_strict(self, tmp_path: Path) -> None:
         """Test cookie check fails in strict mode when file not found."""
@@ -451,6 +674,15 @@ class TestCookieValidation:
         assert result.critical is False  # Non-critical in degraded mode
         assert "youtube" in validator.disabled_providers
 
+    def test_repeated_cookie_failure_disables_provider_once(
+        self, validator_degraded: StartupValidator
+    ) -> None:
+        """Test repeated cookie failures record a disabled provider only once."""
+        validator_degraded._cookie_failure("first")
+        validator_degraded._cookie_failure("second")
+
+        assert validator_degraded.disabled_providers == {"youtube"}
+
     @pytest.mark.asyncio
     async def test_cookie_path_unreadable_strict(self, tmp_path: Path) -> None:
         """Test unreadable cookie path fails the check instead of raising (BUG-001)."""
@@ -466,7 +698,7 @@ class TestCookieValidation:
         )
         validator = StartupValidator(config)
 
-        with patch.object(Path, "exists", side_effect=PermissionError("Permission denied")):
+        with patch.object(Path, "stat", side_effect=PermissionError("Permission denied")):
             result = await validator.check_cookies()
 
         assert result.passed is False
@@ -488,13 +720,41 @@ class TestCookieValidation:
         )
         validator = StartupValidator(config)
 
-        with patch.object(Path, "exists", side_effect=PermissionError("Permission denied")):
+        with patch.object(Path, "stat", side_effect=PermissionError("Permission denied")):
             result = await validator.check_cookies()
 
         assert result.passed is False
         assert result.critical is False
         assert "youtube" in validator.disabled_providers
 
+    @pytest.mark.asyncio
+    async def test_cookie_check_reuses_result_for_unchanged_file(
+        self, validator: StartupValidator, tmp_cookie_file: Path
+    ) -> None:
+        """Test an unchanged cookie file is not re-read on revalidation."""
+        first = await validator.check_cookies()
+
+        with patch.object(StartupValidator, "_count_cookie_entries") as mock_count:
+            second = await validator.check_cookies()
+
+        mock_count.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_cookie_check_rereads_modified_file(
+        self, validator: StartupValidator, tmp_cookie_file: Path
+    ) -> None:
+        """Test a modified cookie file is validated again."""
+        first = await validator.check_cookies()
+        tmp_cookie_file.write_text("not a cookie line\n")
+
+        second = await validator.check_cookies()
+
+        assert first.passed is True
+        assert second.passed is False
+        assert "invalid format" in second.message.lower()
+
     @pytest.mark.asyncio
     async def test_cookie_file_empty(self, tmp_path: Path) -> None:
         """Test cookie check fails when file is empty."""
@@ -701,6 +961,86 @@ class TestFullStartupValidation:
             assert result.success is False
             assert len(result.errors) > 0
 
+    @pytest.mark.asyncio
+    async def test_validate_all_runs_checks_concurrently(
+        self, validator: StartupValidator, tmp_output_dir: Path
+    ) -> None:
+        """Test binary checks overlap instead of running one after another."""
+        running = 0
+        peak = 0
+
+        async def slow_check(name: str) -> CheckResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return CheckResult(name, True, "1.0")
+
+        async def fake_ytdlp() -> CheckResult:
+            return await slow_check("ytdlp")
+
+        async def fake_ffmpeg() -> CheckResult:
+            return await slow_check("ffmpeg")
+
+        async def fake_nodejs(min_version: int) -> CheckResult:
+            return await slow_check("nodejs")
+
+        with (
+            patch("app.core.startup.check_ytdlp", fake_ytdlp),
+            patch("app.core.startup.check_ffmpeg", fake_ffmpeg),
+            patch("app.core.startup.check_nodejs", fake_nodejs),
+            patch.object(validator, "configure_ytdlp_runtime"),
+        ):
+            result = await validator.validate_all()
+
+        assert peak == 3
+        assert [c.name for c in result.checks] == [
+            "ytdlp",
+            "ffmpeg",
+            "nodejs",
+            "storage",
+            "cookies",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_validate_all_records_crashed_check(
+        self, validator: StartupValidator, tmp_output_dir: Path
+    ) -> None:
+        """Test a check that raises becomes a failed result without aborting the rest."""
+        mock_ytdlp = AsyncMock(return_value=CheckResult("ytdlp", True, "2024.01.15"))
+        mock_ffmpeg = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_nodejs = AsyncMock(return_value=CheckResult("nodejs", True, "v20.10.0"))
+        with (
+            patch("app.core.startup.check_ytdlp", mock_ytdlp),
+            patch("app.core.startup.check_ffmpeg", mock_ffmpeg),
+            patch("app.core.startup.check_nodejs", mock_nodejs),
+            patch.object(validator, "configure_ytdlp_runtime"),
+        ):
+            result = await validator.validate_all()
+
+        ffmpeg = next(c for c in result.checks if c.name == "ffmpeg")
+        assert ffmpeg.passed is False
+        assert ffmpeg.critical is True
+        assert "boom" in (ffmpeg.message or "")
+        assert len(result.checks) == 5
+
+    def test_classify_results(self, validator: StartupValidator) -> None:
+        """Test failures are split by criticality and the Node.js result is found."""
+        nodejs = ComponentCheckResult(name="nodejs", passed=False, critical=True)
+        cookies = ComponentCheckResult(name="cookies", passed=False, critical=False)
+        validator.results = [
+            ComponentCheckResult(name="ytdlp", passed=True, critical=True),
+            nodejs,
+            cookies,
+        ]
+
+        critical, non_critical, nodejs_check = validator._classify_results()
+
+        assert critical == [nodejs]
+        assert non_critical == [cookies]
+        assert nodejs_check is nodejs
+
 
 # =============================================================================
 # Tests for yt-dlp config management
@@ -758,6 +1098,34 @@ class TestYtdlpConfigManagement:
         content = config_file.read_text()
         assert content.count("--js-runtimes") == 1
 
+    def test_skips_file_io_once_configured(
+        self, validator: StartupValidator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a configured file is not re-read by later runs in the same process."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+        validator.configure_ytdlp_runtime()
+
+        with patch.object(Path, "read_text") as mock_read:
+            validator.configure_ytdlp_runtime()
+
+        mock_read.assert_not_called()
+        config_file = tmp_path / ".config" / "yt-dlp" / "config"
+        assert config_file.read_text().count("--js-runtimes") == 1
+
+    def test_write_failure_is_not_fatal(
+        self, validator: StartupValidator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed config write is logged and not cached as configured."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+
+        with patch("app.core.startup.os.write", side_effect=OSError("disk full")):
+            validator.configure_ytdlp_runtime()
+
+        validator.configure_ytdlp_runtime()
+
+        config_file = tmp_path / ".config" / "yt-dlp" / "config"
+        assert config_file.read_text().count("--js-runtimes node") == 1
+
     def test_uses_home_directory_if_no_xdg(
         self, validator: StartupValidator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -790,7 +1158,8 @@ class TestDataclasses:
         assert result.critical is False
         assert result.version is None
         assert result.message is None
-        assert result.details == {}
+        assert result.details is None
+        assert not hasattr(result, "__dict__")
 
     def test_component_check_result_with_values(self) -> None:
         """Test ComponentCheckResult with all values."""
@@ -807,6 +1176,18 @@ class TestDataclasses:
         assert result.message == "yt-dlp is available"
         assert result.details == {"path": "/usr/bin/yt-dlp"}
 
+    def test_component_check_result_constructors(self) -> None:
+        """Test the ok and fail constructors set the pass flag and fields."""
+        ok = ComponentCheckResult.ok("ffmpeg", True, version="6.1", message="available")
+        failed = ComponentCheckResult.fail("cookies", False, "missing")
+
+        assert ok == ComponentCheckResult(
+            name="ffmpeg", passed=True, critical=True, version="6.1", message="available"
+        )
+        assert failed == ComponentCheckResult(
+            name="cookies", passed=False, critical=False, message="missing"
+        )
+
     def test_startup_result_defaults(self) -> None:
         """Test StartupResult default values."""
         result = StartupResult(success=True, degraded_mode=False)
@@ -1,6 +1,7 @@
 """Tests for template processor."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -82,6 +83,15 @@ class TestSanitizeFilename(TestTemplateProcessor):
         assert "\x01" not in result
         assert result == "filename.mp4"
 
+    def test_unsafe_char_pattern_matches_translation(self):
+        """Test the pre-check flags exactly the characters the translation changes."""
+        flagged = {
+            chr(code)
+            for code in range(0x80)
+            if TemplateProcessor.UNSAFE_CHAR_PATTERN.search(chr(code))
+        }
+        assert flagged == {chr(code) for code in TemplateProcessor.FILENAME_TRANSLATION}
+
     def test_empty_filename_returns_unnamed(self, processor: TemplateProcessor):
         """Test that empty filename returns 'unnamed'."""
         assert processor.sanitize_filename("") == "unnamed"
@@ -114,6 +124,24 @@ class TestSanitizeFilename(TestTemplateProcessor):
         result = processor.sanitize_filename(f"{reserved_name}.txt")
         assert result.startswith("_")
 
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("CON", True),
+            ("con.txt", True),
+            ("Lpt9.mp4", True),
+            ("COM0", False),
+            ("CONSOLE", False),
+            ("CON.tar.gz", False),
+            ("video.CON", False),
+            ("ｃon", False),
+            ("", False),
+        ],
+    )
+    def test_is_windows_reserved(self, filename: str, expected: bool):
+        """Test reserved name detection looks only at the name before the last dot."""
+        assert TemplateProcessor._is_windows_reserved(filename) is expected
+
     def test_long_filename_truncated(self, processor: TemplateProcessor):
         """Test that overly long filenames are truncated."""
         long_name = "a" * 300 + ".mp4"
@@ -156,6 +184,18 @@ class TestSanitizeFilename(TestTemplateProcessor):
         result = processor.sanitize_filename("café.mp4")
         assert "café" in result or "cafe" in result  # Depends on normalization
 
+    def test_fullwidth_chars_normalized(self, processor: TemplateProcessor):
+        """Test NFKC maps fullwidth forms to ASCII before sanitizing."""
+        assert processor.sanitize_filename("ＡＢＣ＜1＞.mp4") == "ABC_1_.mp4"
+
+    def test_ascii_filename_skips_normalization(self, processor: TemplateProcessor):
+        """Test ASCII filenames bypass unicodedata.normalize."""
+        with patch("app.core.template.unicodedata.normalize") as mock_normalize:
+            result = processor.sanitize_filename("My Video-abc123.mp4")
+
+        assert result == "My Video-abc123.mp4"
+        mock_normalize.assert_not_called()
+
 
 class TestValidateTemplate(TestTemplateProcessor):
     """Tests for template validation."""
@@ -237,6 +277,17 @@ class TestValidateTemplate(TestTemplateProcessor):
 class TestValidateOutputPath(TestTemplateProcessor):
     """Tests for output path validation."""
 
+    def test_output_dir_resolved_once(self, temp_processor: TemplateProcessor):
+        """Test the output directory is resolved on first use only."""
+        path = f"{temp_processor.output_dir}/video.mp4"
+
+        with patch.object(Path, "resolve", autospec=True, side_effect=lambda p: p) as mock:
+            temp_processor.validate_output_path(path)
+            temp_processor.validate_output_path(path)
+
+        # Two resolves for the first call (path and directory), one for the second
+        assert mock.call_count == 3
+
     def test_valid_path_within_output_dir(self, temp_processor: TemplateProcessor):
         """Test that paths within output directory are accepted."""
         output_dir = temp_processor.output_dir
@@ -288,6 +339,26 @@ class TestProcessTemplate(TestTemplateProcessor):
         result = processor.process_template(template, variables)
         assert isinstance(result.is_valid, bool)
 
+    @pytest.mark.parametrize(
+        "variables",
+        [
+            {"title": "My Video", "id": "abc123", "ext": "mp4"},
+            {"title": "My Video", "id": 123, "ext": "mp4"},
+            {"title": "My Video", "ext": "mp4"},
+        ],
+    )
+    def test_default_template_matches_generic_formatting(
+        self, processor: TemplateProcessor, variables
+    ):
+        """Test that the default-template fast path formats like % does."""
+        result = processor.process_template(processor.DEFAULT_TEMPLATE, variables)
+        try:
+            expected = processor.sanitize_filename(processor.DEFAULT_TEMPLATE % variables)
+        except KeyError as e:
+            assert result.error_message == f"Missing template variable: {e}"
+        else:
+            assert result.processed_path == expected
+
     def test_result_is_sanitized(self, processor: TemplateProcessor):
         """Test that processed result is sanitized."""
         template = "%(title)s.%(ext)s"
@@ -351,6 +422,24 @@ class TestGetUniqueFilename(TestTemplateProcessor):
         filename = temp_processor.get_unique_filename(str(tmp_path), "video.mp4")
         assert filename == "video_3.mp4"
 
+    def test_unique_filename_scans_directory_once(
+        self, temp_processor: TemplateProcessor, tmp_path: Path
+    ):
+        """Test many conflicts cost one directory scan, not one stat per candidate."""
+        (tmp_path / "video.mp4").touch()
+        for i in range(1, 50):
+            (tmp_path / f"video_{i}.mp4").touch()
+
+        real_exists = Path.exists
+        with patch.object(
+            Path, "exists", autospec=True, side_effect=lambda p: real_exists(p)
+        ) as mock_exists:
+            filename = temp_processor.get_unique_filename(str(tmp_path), "video.mp4")
+
+        assert filename == "video_50.mp4"
+        # The initial collision check and the final confirmation of the free name
+        assert mock_exists.call_count == 2
+
     def test_unique_filename_no_extension(self, temp_processor: TemplateProcessor, tmp_path: Path):
         """Test unique filename for files without extension."""
         (tmp_path / "video").touch()
@@ -385,6 +474,34 @@ class TestBuildOutputPath(TestTemplateProcessor):
         assert result.is_valid is True
         assert "My Video" in result.processed_path
 
+    def test_build_path_plain_name_skips_resolve(
+        self, temp_processor: TemplateProcessor, tmp_path: Path
+    ):
+        """Test a sanitized plain filename is accepted without resolving the path."""
+        variables = {"title": "video", "id": "abc", "ext": "mp4"}
+
+        with patch.object(temp_processor, "validate_output_path") as mock_validate:
+            result = temp_processor.build_output_path("%(title)s.%(ext)s", variables)
+
+        assert result.is_valid is True
+        assert result.processed_path == str(tmp_path / "video.mp4")
+        mock_validate.assert_not_called()
+
+    def test_build_path_symlink_escape_rejected(
+        self, temp_processor: TemplateProcessor, tmp_path: Path, tmp_path_factory
+    ):
+        """Test an existing symlink out of the output directory still fails validation."""
+        outside = tmp_path_factory.mktemp("outside") / "target.mp4"
+        (tmp_path / "video.mp4").symlink_to(outside)
+        variables = {"title": "video", "id": "abc", "ext": "mp4"}
+
+        result = temp_processor.build_output_path(
+            "%(title)s.%(ext)s", variables, ensure_unique=False
+        )
+
+        assert result.is_valid is False
+        assert "within the configured output directory" in result.error_message
+
     def test_build_path_ensures_unique(self, temp_processor: TemplateProcessor, tmp_path: Path):
         """Test that unique filename is generated when file exists."""
         variables = {"title": "video", "id": "abc", "ext": "mp4"}
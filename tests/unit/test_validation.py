@@ -1,5 +1,8 @@
 """Tests for input validation utilities."""
 
+from unittest.mock import patch
+from urllib.parse import urlparse
+
 import pytest
 
 from app.core.validation import (
@@ -123,6 +126,63 @@ class TestURLValidator:
             "evil.com" in result.error_message or "not in the allowed list" in result.error_message
         )
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=abc",
+            "HTTPS://YouTube.com?v=abc",
+            "http://youtu.be#t=10",
+            "https://youtube.com.evil.com/watch",
+            "https://youtube.com\\@evil.com/watch",
+            "https://you\ttube.com/watch",
+            "https://evil.com@youtube.com/watch",
+            "https://\u212atube.com/watch",
+        ],
+    )
+    def test_simple_url_fast_path_matches_urlparse(self, validator: URLValidator, url: str):
+        """Test the regex fast path extracts the same host urlparse would, or defers."""
+        match = URLValidator.SIMPLE_URL_PATTERN.match(url)
+        if match:
+            assert match.group(1).lower() == urlparse(url).hostname
+
+        with patch("app.core.validation.urlparse", wraps=urlparse) as mock_urlparse:
+            result = validator.validate(url)
+
+        assert result.is_valid is (urlparse(url).hostname in validator.allowed_domains)
+        assert mock_urlparse.called is (match is None)
+
+    def test_simple_url_fast_path_is_ascii_only(self):
+        """Test non-ASCII hosts never take the fast path, even case-folding to ASCII."""
+        assert URLValidator.SIMPLE_URL_PATTERN.match("https://\u212atube.com/") is None
+
+    def test_repeated_url_served_from_cache(self, validator: URLValidator):
+        """Test a repeated URL is validated once and the same result returned."""
+        url = "https://www.youtube.com/watch?v=abc"
+
+        first = validator.validate(url)
+        second = validator.validate(url)
+
+        assert second is first
+        assert list(validator._cache) == [url]
+
+    def test_invalid_and_long_urls_not_cached(self, validator: URLValidator):
+        """Test failed validations and URLs over the length cap are not memoized."""
+        long_url = (
+            "https://www.youtube.com/watch?v=abc&pad=" + "x" * URLValidator.CACHE_MAX_URL_LENGTH
+        )
+
+        assert validator.validate("https://example.com/video").is_valid is False
+        assert validator.validate(long_url).is_valid is True
+        assert validator._cache == {}
+
+    def test_cache_is_bounded(self, validator: URLValidator, monkeypatch: pytest.MonkeyPatch):
+        """Test least recently used URLs are evicted at the size limit."""
+        monkeypatch.setattr(URLValidator, "CACHE_SIZE", 2)
+        for video_id in ("a", "b", "a", "c"):
+            validator.validate(f"https://youtu.be/{video_id}")
+
+        assert list(validator._cache) == ["https://youtu.be/a", "https://youtu.be/c"]
+
     def test_custom_allowed_domains(self):
         """Test validator with custom domain whitelist."""
         custom_validator = URLValidator(allowed_domains={"example.com", "test.org"})
@@ -380,6 +440,13 @@ class TestValidationResult:
         with pytest.raises(AttributeError):
             result.is_valid = False
 
+    def test_fixed_failures_are_shared(self):
+        """Test that failures with a fixed message reuse one instance."""
+        validator = FormatValidator()
+        first = validator.validate_format_id("bad format!")
+        assert first is validator.validate_format_id("also bad!")
+        assert first.error_message == "Format ID contains invalid characters"
+
 
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
@@ -9,11 +9,13 @@ Test Pattern Reference: tests/unit/test_cookie_service.py (Task 3.4)
 
 import asyncio
 import json
+import re
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.providers.base import VideoProvider
 from app.providers.exceptions import (
     DownloadError,
     InvalidURLError,
@@ -173,6 +175,13 @@ class TestURLValidation:
         result = youtube_provider.validate_url(url)
         assert result == expected
 
+    def test_url_patterns_compiled_from_url_patterns(self):
+        """Test URL_PATTERNS compile into one case-insensitive alternation."""
+        (combined,) = YouTubeProvider.url_patterns
+        assert combined.flags & re.IGNORECASE
+        for pattern in YouTubeProvider.URL_PATTERNS:
+            assert f"(?:{pattern})" in combined.pattern
+
     @pytest.mark.parametrize(
         "url,expected_id",
         [
@@ -187,6 +196,35 @@ class TestURLValidation:
         video_id = youtube_provider.extract_video_id(url)
         assert video_id == expected_id
 
+    @pytest.mark.parametrize(
+        "url,expected_id",
+        [
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/embed/abc-123", "abc-123"),
+            ("https://m.youtube.com/watch?v=xyz789&t=42", "xyz789"),
+            ("https://YOUTU.BE/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://YOUTUBE.COM/WATCH?V=abc", "abc"),
+            ("https://example.com/watch?v=dQw4w9WgXcQ", None),
+            ("https://m.youtube.com/shorts/abc123", None),
+            ("", None),
+        ],
+    )
+    def test_parse_url(self, youtube_provider, url, expected_id):
+        """Test one match validates the URL and captures the video ID."""
+        assert youtube_provider._parse_url(url) == expected_id
+        assert youtube_provider.extract_video_id(url) == expected_id
+        assert youtube_provider.validate_url(url) is (expected_id is not None)
+
+    @pytest.mark.parametrize("url", [None, ""])
+    def test_validate_url_rejects_empty_url(self, youtube_provider, url):
+        """Test a missing or empty URL is rejected instead of raising."""
+        assert youtube_provider.validate_url(url) is False
+
+    def test_validate_url_is_the_pattern_default(self):
+        """Test validate_url is inherited, so the manager can match patterns inline."""
+        assert YouTubeProvider.validate_url is VideoProvider.validate_url
+
     def test_extract_video_id_failure(self, youtube_provider):
         """Test video ID extraction from invalid URL returns None."""
         video_id = youtube_provider.extract_video_id("https://example.com")
@@ -322,6 +360,20 @@ class TestMetadataExtraction:
             with pytest.raises(DownloadError, match="Failed to parse"):
                 await youtube_provider.get_info("https://youtube.com/watch?v=test")
 
+    @pytest.mark.asyncio
+    async def test_get_info_accepts_non_finite_numbers(self, youtube_provider):
+        """yt-dlp may emit NaN/Infinity literals; they parse and map to defaults."""
+        stdout = b'{"id": "dQw4w9WgXcQ", "title": "t", "duration": NaN, "view_count": 1}'
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.returncode = 0
+            mock_process.communicate = AsyncMock(return_value=(stdout, b""))
+            mock_subprocess.return_value = mock_process
+
+            result = await youtube_provider.get_info("https://youtube.com/watch?v=dQw4w9WgXcQ")
+
+        assert result["duration"] == 0
+
     @pytest.mark.asyncio
     async def test_get_info_cookie_validation_called(
         self, youtube_provider, mock_cookie_service, sample_video_metadata
@@ -340,6 +392,89 @@ class TestMetadataExtraction:
             mock_cookie_service.validate_cookie.assert_called_once_with("youtube")
 
 
+class TestInfoCoalescing:
+    """Concurrent get_info calls for the same video share one yt-dlp run."""
+
+    @staticmethod
+    def _gated_run(sample_video_metadata):
+        """Build a gated _execute_with_retry replacement and its call list."""
+        release = asyncio.Event()
+        calls = []
+
+        async def run(cmd, timeout=None):
+            calls.append(cmd)
+            await release.wait()
+            return MagicMock(stdout=json.dumps(sample_video_metadata).encode())
+
+        return run, release, calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self, youtube_provider, sample_video_metadata):
+        """Identical concurrent requests run yt-dlp once and get the same info."""
+        run, release, calls = self._gated_run(sample_video_metadata)
+        url = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+        with patch.object(youtube_provider, "_execute_with_retry", side_effect=run):
+            pending = [asyncio.ensure_future(youtube_provider.get_info(url)) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+
+        assert len(calls) == 1
+        assert all(result["video_id"] == "dQw4w9WgXcQ" for result in results)
+        assert youtube_provider._info_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_options_run_separately(self, youtube_provider, sample_video_metadata):
+        """Requests differing in include flags are not coalesced."""
+        run, release, calls = self._gated_run(sample_video_metadata)
+        url = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+        with patch.object(youtube_provider, "_execute_with_retry", side_effect=run):
+            pending = [
+                asyncio.ensure_future(youtube_provider.get_info(url)),
+                asyncio.ensure_future(youtube_provider.get_info(url, include_formats=True)),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*pending)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_run(
+        self, youtube_provider, sample_video_metadata
+    ):
+        """Cancelling one waiter leaves the run going for the others."""
+        run, release, calls = self._gated_run(sample_video_metadata)
+        url = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+        with patch.object(youtube_provider, "_execute_with_retry", side_effect=run):
+            first = asyncio.ensure_future(youtube_provider.get_info(url))
+            second = asyncio.ensure_future(youtube_provider.get_info(url))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            result = await second
+
+        assert first.cancelled()
+        assert result["video_id"] == "dQw4w9WgXcQ"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_run_is_not_reused(self, youtube_provider, sample_video_metadata):
+        """Coalescing only covers in-flight runs; later calls run yt-dlp again."""
+        run, release, calls = self._gated_run(sample_video_metadata)
+        release.set()
+        url = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+        with patch.object(youtube_provider, "_execute_with_retry", side_effect=run):
+            await youtube_provider.get_info(url)
+            await youtube_provider.get_info(url)
+
+        assert len(calls) == 2
+
+
 class TestFormatListing:
     """Test format parsing, categorization, and listing."""
 
@@ -450,6 +585,21 @@ class TestFormatListing:
             assert formats[0].format_id == "137"
             assert formats[0].resolution == "1920x1080"
 
+    @pytest.mark.asyncio
+    async def test_list_formats_reuses_parsed_url(self, youtube_provider):
+        """Test list_formats fetches info without re-entering get_info."""
+        fetched = AsyncMock(return_value={"formats": []})
+        with (
+            patch.object(youtube_provider, "_fetch_info", fetched),
+            patch.object(youtube_provider, "get_info") as get_info,
+        ):
+            await youtube_provider.list_formats("https://youtube.com/watch?v=dQw4w9WgXcQ")
+
+        get_info.assert_not_called()
+        fetched.assert_awaited_once_with(
+            "https://youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ", True, False
+        )
+
     @pytest.mark.asyncio
     async def test_list_formats_with_real_float_bitrates(self, youtube_provider):
         """Test VideoFormat gets int bitrates when yt-dlp reports floats.